@@ -1,9 +1,25 @@
 import streamlit as st
-import random
+import os
 import string
+import tempfile
 
-def generate_password(length, characters):
-    return ''.join(random.choice(characters) for _ in range(length))
+from pw_generate import FORMATS, export, make_batch
+from pw_policy import AMBIGUOUS, Policy
+from pw_unique import IssuedStore
+from pw_words import WORDS_PATH, WordList
+
+# The finished export is read into memory to be served, so its size is capped.
+MAX_EXPORT_BYTES = 200_000_000
+
+@st.cache_resource
+def get_issued_store():
+    return IssuedStore()
+
+
+@st.cache_resource(max_entries=1)
+def get_wordlist(modified):
+    # Keyed on the file's mtime, so rebuilding the list is picked up without a restart.
+    return WordList()
 
 
 st.set_page_config(page_title="Password Generator", page_icon="🔐")
@@ -35,27 +51,159 @@ use_lower = st.checkbox("Include Lowercase Letters (a-z)", value=True)
 use_digits = st.checkbox("Include Numbers (0-9)", value=True)
 use_symbols = st.checkbox("Include Special Characters (!@#$)", value=True)
 
-if st.button("Generate Passwords"):
-    characters = ""
+characters = ""
+if use_upper:
+    characters += string.ascii_uppercase
+if use_lower:
+    characters += string.ascii_lowercase
+if use_digits:
+    characters += string.digits
+if use_symbols:
+    characters += string.punctuation
+
+# Policy: minimum counts per class and extra rules, met by construction
+with st.expander("📋 Password Policy"):
+    classes = [name for name, on in (("upper", use_upper), ("lower", use_lower),
+                                     ("digits", use_digits), ("symbols", use_symbols)) if on]
+    labels = {"upper": "uppercase letters", "lower": "lowercase letters", "digits": "numbers", "symbols": "special characters"}
+    columns = st.columns(max(len(classes), 1))
+    minimums = {}
+    for column, name in zip(columns, classes):
+        with column:
+            minimums[name] = st.number_input(f"Min {labels[name]}", min_value=0, max_value=length, value=0, key=f"min_{name}")
+    avoid_ambiguous = st.checkbox(f"Avoid ambiguous characters ({' '.join(AMBIGUOUS)})")
+    no_repeats = st.checkbox("No repeated characters in a row")
+
+source = characters
+policy_error = None
+if characters and (any(minimums.values()) or avoid_ambiguous or no_repeats):
+    try:
+        source = Policy(classes, minimums, avoid_ambiguous, no_repeats)
+        source.check(length)
+    except ValueError as e:
+        policy_error = f"❌ {e}."
 
-    if use_upper:
-        characters += string.ascii_uppercase
-    if use_lower:
-        characters += string.ascii_lowercase
-    if use_digits:
-        characters += string.digits
-    if use_symbols:
-        characters += string.punctuation
+# Uniqueness across this batch and everything issued before
+unique = st.checkbox("Never repeat a password (checked against every password issued so far)")
+issued = get_issued_store() if unique else None
+if issued:
+    rate = issued.false_positive_rate()
+    st.caption(f"{issued.count:,} passwords issued so far"
+               + (" · exact check" if issued.bloom is None else f" · Bloom filter, {rate:.1e} false positive rate"))
 
+if st.button("Generate Passwords"):
     if not characters:
         st.error("❌ Please select at least one character type.")
+    elif policy_error:
+        st.error(policy_error)
     else:
-        st.success("✅ Generated Passwords:")
-        for _ in range(count):
-            password = generate_password(length, characters)
+        try:
+            passwords = issued.generate(count, length, source) if issued else make_batch(count, length, source)
+        except ValueError as e:
+            passwords = []
+            st.error(f"❌ {e}.")
+        if issued:
+            issued.save()
+        if passwords:
+            st.success("✅ Generated Passwords:")
+        for password in passwords:
             st.code(password)
             st.session_state.history.append(password)
 
+# Export a large batch straight to a file
+st.divider()
+st.subheader("📦 Export to File")
+st.caption("Streams passwords to a file in chunks instead of showing them; they are not added to the history. "
+           f"Files are limited to about {MAX_EXPORT_BYTES / 1e6:,.0f} MB and are deleted once downloaded.")
+
+export_format = st.radio("File format", ["txt", "csv"], horizontal=True,
+                         format_func=lambda fmt: "Plain text" if fmt == "txt" else "CSV",
+                         help="In CSV, passwords starting with = + - @ ' (or a tab or carriage return) get "
+                              "an extra leading ' so spreadsheets don't run them as formulas; remove exactly "
+                              "one leading ' when reading the file elsewhere.")
+# Bytes per password: a newline, or for CSV an index of up to 8 digits,
+# a comma, an escaping ' or quotes, and CRLF.
+line_bytes = length + 1 if export_format == "txt" else length + 14
+max_export = min(10_000_000, MAX_EXPORT_BYTES // line_bytes)
+export_count = st.number_input(
+    "How many passwords to export?",
+    min_value=1,
+    max_value=max_export,
+    value=min(100_000, max_export),
+    step=10_000,
+    help=f"At this length and format, up to {max_export:,} passwords fit in the size limit."
+)
+
+if st.button("Export Passwords"):
+    if not characters:
+        st.error("❌ Please select at least one character type.")
+    elif policy_error:
+        st.error(policy_error)
+    else:
+        if st.session_state.get("export") and os.path.exists(st.session_state.export[0]):
+            os.remove(st.session_state.export[0])
+        bar = st.progress(0.0, text="Generating…")
+        fd, path = tempfile.mkstemp(prefix="passwords-", suffix=f".{export_format}")
+        os.close(fd)
+        try:
+            export(path, export_count, length, source, export_format,
+                   progress=lambda done, total: bar.progress(done / total, text=f"{done:,} / {total:,} passwords"),
+                   issued=issued)
+        except ValueError as e:
+            os.remove(path)
+            bar.empty()
+            st.error(f"❌ {e}.")
+        except BaseException:
+            # Also covers a rerun interrupting the export: never leave half a file behind.
+            os.remove(path)
+            raise
+        else:
+            st.session_state.export = (path, f"passwords.{export_format}", FORMATS[export_format])
+        finally:
+            if issued:
+                issued.save()
+
+if st.session_state.get("export") and not os.path.exists(st.session_state.export[0]):
+    st.session_state.export = None      # downloaded, and deleted by read_export
+if st.session_state.get("export"):
+    path, file_name, mime = st.session_state.export
+
+    def read_export():
+        # Runs when the download is clicked; the file is only needed once.
+        with open(path, "rb") as f:
+            data = f.read()
+        os.remove(path)
+        return data
+
+    st.success(f"✅ {os.path.getsize(path) / 1e6:,.1f} MB ready.")
+    st.download_button("⬇️ Download", data=read_export, file_name=file_name, mime=mime)
+
+# Passphrases from a memory-mapped wordlist
+st.divider()
+st.subheader("🎲 Passphrase")
+
+wordlist = None
+if not os.path.exists(WORDS_PATH):
+    st.info("Passphrases need a wordlist. The server admin can build one from any list with one word per line "
+            "(diceware lists such as the EFF large wordlist work as-is): `python pw_words.py build words.txt`")
+else:
+    try:
+        wordlist = get_wordlist(os.path.getmtime(WORDS_PATH))
+    except ValueError as e:
+        st.error(f"❌ {e}.")
+if wordlist:
+    word_count = st.slider("Number of words", min_value=3, max_value=12, value=6)
+    separator = st.selectbox("Separator", [" ", "-", ".", "_"],
+                             format_func=lambda sep: "Space" if sep == " " else sep)
+    capitalize = st.checkbox("Capitalize each word")
+    st.caption(f"{len(wordlist):,} words · {word_count * wordlist.bits_per_word():.0f} bits of entropy")
+    if st.button("Generate Passphrases"):
+        st.success("✅ Generated Passphrases:")
+        for _ in range(count):
+            phrase = wordlist.passphrase(word_count, separator, capitalize)
+            st.code(phrase)
+            st.session_state.history.append(phrase)
+
 # Show history
 st.divider()
 st.subheader("📜 Password History")
@@ -1,5 +1,17 @@
+import uuid
+
 import streamlit as st
-from PIL import Image, ImageDraw, ImageFont
+
+from ttt_board import PRESETS
+from ttt_game import Game
+from ttt_log import GameLog, replay
+from ttt_mcts import MCTSPlayer
+from ttt_openings import OpeningIndex
+from ttt_render import render_png, render_svg
+from ttt_rooms import RoomStore
+from ttt_table import LOSS, WIN, PerfectPlayTable
+
+ROOM_POLL_SECONDS = 1.0   # how often a waiting room player checks for changes
 
 st.set_page_config(page_title="Tic-Tac-Toe 🎮", page_icon="🎮", layout="centered")
 
@@ -8,109 +20,246 @@ st.set_page_config(page_title="Tic-Tac-Toe 🎮", page_icon="🎮", layout="cent
 # ---------------------
 if "started" not in st.session_state:
     st.session_state.started = False
-if "board" not in st.session_state:
-    st.session_state.board = [""] * 9
-if "player" not in st.session_state:
-    st.session_state.player = "X"
-if "winner" not in st.session_state:
-    st.session_state.winner = None
-if "win_combo" not in st.session_state:
-    st.session_state.win_combo = []
+if "game" not in st.session_state:
+    st.session_state.game = Game()
+if "mode" not in st.session_state:
+    st.session_state.mode = "2 Players"
+if "opponent" not in st.session_state:
+    st.session_state.opponent = "Perfect"
+if "budget" not in st.session_state:
+    st.session_state.budget = 1.0
+if "ai_stats" not in st.session_state:
+    st.session_state.ai_stats = None
+if "recorded" not in st.session_state:
+    st.session_state.recorded = False
+if "client_id" not in st.session_state:
+    st.session_state.client_id = uuid.uuid4().hex
+if "room" not in st.session_state:
+    st.session_state.room = None
+if "mark" not in st.session_state:
+    st.session_state.mark = None
 
 # ---------------------
 # Functions
 # ---------------------
-def check_winner(board):
-    combos = [
-        [0,1,2], [3,4,5], [6,7,8],
-        [0,3,6], [1,4,7], [2,5,8],
-        [0,4,8], [2,4,6]
-    ]
-    for c in combos:
-        if board[c[0]] == board[c[1]] == board[c[2]] != "":
-            st.session_state.win_combo = c
-            return board[c[0]]
-    if "" not in board:
-        return "Draw"
-    return None
+@st.cache_resource
+def get_table():
+    return PerfectPlayTable.load()
+
+@st.cache_resource
+def get_openings():
+    return OpeningIndex.load()
+
+@st.cache_resource
+def get_rooms():
+    return RoomStore()
+
+@st.cache_resource
+def get_mcts():
+    return MCTSPlayer()
+
+def computer_move(game):
+    if st.session_state.opponent == "Perfect":
+        return get_table().best_move(game.board)
+    player = get_mcts()
+    move, playouts, rate = player.choose(game.board, game.n, game.k, game.player, game.turns, st.session_state.budget)
+    st.session_state.ai_stats = (playouts, rate, player.workers)
+    return move
+
+def record_game(game, game_no=None):
+    # Only classic 3×3 games fit the packed move-log format; in a room
+    # only the X player's session writes the shared game, once per game
+    # number, whichever player started it.
+    if st.session_state.room and st.session_state.mark != "X":
+        return
+    marker = (st.session_state.room, game_no) if st.session_state.room else True
+    if game.n == 3 and game.k == 3 and st.session_state.recorded != marker:
+        GameLog().append(game.history, game.winner())
+        st.session_state.recorded = marker
+
+def undo_move():
+    game = st.session_state.game
+    st.session_state.recorded = False
+    game.undo()
+    # Against the computer, take back its reply as well as your own move.
+    if st.session_state.mode == "Play vs. computer" and game.player != "X":
+        game.undo()
 
 def reset_game():
-    st.session_state.board = [""] * 9
-    st.session_state.player = "X"
-    st.session_state.winner = None
-    st.session_state.win_combo = []
+    if st.session_state.room:
+        get_rooms().leave(st.session_state.room, st.session_state.client_id)
+    st.session_state.game = Game(st.session_state.game.n, st.session_state.game.k)
+    st.session_state.recorded = False
     st.session_state.started = False
+    st.session_state.room = None
+    st.session_state.mark = None
+
+def reset_room():
+    get_rooms().reset(st.session_state.room)
+
+@st.fragment(run_every=ROOM_POLL_SECONDS)
+def watch_room(room, seen):
+    # Reruns on its own timer without holding up the page, so clicks
+    # elsewhere still go through; reruns the whole page once the room changes.
+    if get_rooms().version(room) != seen:
+        st.rerun()
+
+def draw_board(game):
+    return render_png(tuple(game.board), tuple(game.win_combo), game.n)
 
-def draw_board():
-    size = 300
-    cell_size = size // 3
-    img = Image.new("RGB", (size, size), "white")
-    draw = ImageDraw.Draw(img)
-    
-    # Draw grid
-    for i in range(1,3):
-        draw.line((0, i*cell_size, size, i*cell_size), fill="black", width=4)
-        draw.line((i*cell_size, 0, i*cell_size, size), fill="black", width=4)
-    
-    # Draw X and O
-    font = ImageFont.load_default()
-    for i, mark in enumerate(st.session_state.board):
-        x = (i % 3) * cell_size + cell_size//2
-        y = (i // 3) * cell_size + cell_size//2
-        if mark == "X":
-            draw.text((x-10, y-10), "X", fill="red", font=font)
-        elif mark == "O":
-            draw.text((x-10, y-10), "O", fill="blue", font=font)
-    
-    # Draw win line
-    if st.session_state.win_combo:
-        c = st.session_state.win_combo
-        x1 = (c[0]%3)*cell_size + cell_size//2
-        y1 = (c[0]//3)*cell_size + cell_size//2
-        x2 = (c[2]%3)*cell_size + cell_size//2
-        y2 = (c[2]//3)*cell_size + cell_size//2
-        draw.line((x1, y1, x2, y2), fill="green", width=6)
-    
-    return img
+def draw_board_svg(game):
+    return render_svg(tuple(game.board), tuple(game.win_combo), game.n)
+
+renderer = st.sidebar.radio("Board renderer", ["PNG", "SVG"], help="SVG sends a few hundred bytes per move and stays sharp at any width.")
 
 # ---------------------
 # Welcome Screen + Start
 # ---------------------
 if not st.session_state.started:
     st.markdown("<h1 style='text-align:center; color:darkblue;'>🎮 Welcome to Tic-Tac-Toe 🎮</h1>", unsafe_allow_html=True)
-    st.markdown("<p style='text-align:center;'>Click Start to begin 2-Player game!</p>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align:center;'>Pick a mode and click Start to begin!</p>", unsafe_allow_html=True)
+    preset = st.selectbox("Board", list(PRESETS))
+    n, k = PRESETS[preset]
+    mode = st.radio("Mode", ["2 Players", "Play vs. computer", "Online room"], horizontal=True)
+    opponent, budget = "MCTS", 1.0
+    room_code = None
+    if mode == "Online room":
+        if st.radio("Room", ["Create a room", "Join a room"], horizontal=True) == "Join a room":
+            room_code = st.text_input("Room code").strip().upper()
+            st.caption("The board size is set by whoever created the room.")
+    if mode == "Play vs. computer":
+        if n == 3:
+            opponent = st.radio("Opponent", ["Perfect", "MCTS"], horizontal=True)
+        if opponent == "MCTS":
+            budget = st.slider("Thinking time (seconds)", 0.1, 5.0, 1.0, 0.1)
     if st.button("Start Game 🕹️"):
+        if mode == "Online room":
+            rooms = get_rooms()
+            if room_code is None:
+                room_code = rooms.create(n, k)
+            elif room_code not in rooms.rooms:
+                st.error(f"❌ No room with code {room_code}.")
+                st.stop()
+            st.session_state.room = room_code
+            st.session_state.mark = rooms.join(room_code, st.session_state.client_id)
         st.session_state.started = True
+        st.session_state.mode = mode
+        st.session_state.opponent = opponent
+        st.session_state.budget = budget
+        st.session_state.ai_stats = None
+        st.session_state.game = Game(n, k)
+        st.session_state.recorded = False
     st.stop()
 
 # ---------------------
 # Game Board Interaction
 # ---------------------
-cols = st.columns(3)
-for i in range(9):
-    if cols[i%3].button(st.session_state.board[i] if st.session_state.board[i] != "" else " ", key=i):
-        if st.session_state.board[i] == "" and st.session_state.winner is None:
-            st.session_state.board[i] = st.session_state.player
-            st.session_state.winner = check_winner(st.session_state.board)
-            st.session_state.player = "O" if st.session_state.player == "X" else "X"
+room = st.session_state.room
+if room:
+    room_version, game, players, game_no = get_rooms().snapshot(room)
+    mark = st.session_state.mark
+    opponent_seat = "O" if mark == "X" else "X"
+    status = f"you are **{mark}**" if mark else "you are spectating"
+    if mark and players[opponent_seat] is None:
+        status += " · waiting for an opponent to join"
+    st.info(f"Room **{room}** · {status}")
+else:
+    game = st.session_state.game
+n = game.n
+cols = st.columns(n)
+for i in range(n * n):
+    if cols[i%n].button(game.board[i] if game.board[i] != "" else " ", key=i):
+        if room:
+            if get_rooms().play(room, st.session_state.client_id, i):
+                st.rerun()
+        elif game.board[i] == "" and not game.is_over():
+            game.play(i)
+            if st.session_state.mode == "Play vs. computer" and not game.is_over():
+                game.play(computer_move(game))
+
+# ---------------------
+# Hints
+# ---------------------
+if game.n == 3 and game.k == 3 and not game.is_over() and st.checkbox("Show hints 💡"):
+    entry = get_table().lookup(game.board)
+    cells = ", ".join(f"row {m//3 + 1} col {m%3 + 1}" for m in entry.moves)
+    st.caption(f"Best moves for {game.player}: {cells}")
+    if entry.value == WIN:
+        st.success(f"{game.player} can force a win in {(entry.depth + 1) // 2} move(s).")
+    elif entry.value == LOSS:
+        st.warning(f"This position is lost for {game.player} against perfect play.")
+
+if game.n == 3 and game.k == 3 and not game.is_over():
+    with st.expander("📖 Opening explorer"):
+        index = get_openings()
+        if index.sync(GameLog()):
+            index.save()
+        replies = index.lookup(game.board)
+        if replies:
+            rows = [{"Cell": f"row {m//3 + 1} col {m%3 + 1}", "Played": played,
+                     "Win": f"{w:.0%}", "Draw": f"{d:.0%}", "Loss": f"{l:.0%}"}
+                    for m, (played, w, d, l) in sorted(replies.items(), key=lambda kv: -kv[1][0])]
+            st.table(rows)
+            st.caption(f"Rates are for {game.player}; mirrored cells share statistics.")
+        else:
+            st.caption("No recorded games reached this position yet.")
+
+if st.session_state.ai_stats:
+    playouts, rate, workers = st.session_state.ai_stats
+    st.caption(f"MCTS: {playouts:,} playouts at {rate:,.0f}/s on {workers} worker(s)")
 
 # ---------------------
 # Display Board
 # ---------------------
-st.image(draw_board(), use_column_width=True)
+if renderer == "SVG":
+    st.markdown(draw_board_svg(game), unsafe_allow_html=True)
+else:
+    st.image(draw_board(game), use_column_width=True)
 
 # ---------------------
 # Winner Display & Celebration
 # ---------------------
-if st.session_state.winner:
-    if st.session_state.winner == "Draw":
+if game.winner():
+    record_game(game, game_no if room else None)
+    if game.winner() == "Draw":
         st.markdown("<h2 style='text-align:center;'>It's a Draw! 🤝</h2>", unsafe_allow_html=True)
     else:
-        winner_name = "Player X" if st.session_state.winner == "X" else "Player O"
+        winner_name = "Player X" if game.winner() == "X" else "Player O"
         st.markdown(f"<h2 style='text-align:center; color:blue;'>🏆 {winner_name} Wins! 🏆</h2>", unsafe_allow_html=True)
         st.markdown("<p style='text-align:center; font-size:50px;'>🎉🎊🥳🎉🎊🥳</p>", unsafe_allow_html=True)
 
 # ---------------------
-# Reset Button
+# Undo & Reset Buttons
+# ---------------------
+if room:
+    st.button("Play Again 🔄", on_click=reset_room, disabled=not game.is_over())
+    st.button("Leave Room 🚪", on_click=reset_game)
+else:
+    st.button("Undo ↩️", on_click=undo_move, disabled=not game.history)
+    st.button("Play Again 🔄", on_click=reset_game)
+
+# ---------------------
+# Replay Viewer
+# ---------------------
+log = GameLog()
+if len(log):
+    with st.expander(f"📼 Replay past games ({len(log):,} recorded)"):
+        games = log.tail(20)
+        labels = {index: f"Game #{index + 1}: {winner if winner == 'Draw' else winner + ' wins'} in {len(moves)} moves"
+                  for index, moves, winner in games}
+        choice = st.selectbox("Game", list(labels), format_func=labels.get)
+        moves = next(m for index, m, _ in games if index == choice)
+        step = st.slider("Move", 0, len(moves), len(moves))
+        frame = list(replay(moves))[step]
+        if renderer == "SVG":
+            st.markdown(render_svg(tuple(frame.board), tuple(frame.win_combo), 3), unsafe_allow_html=True)
+        else:
+            st.image(render_png(tuple(frame.board), tuple(frame.win_combo), 3), width=300)
+
+# ---------------------
+# Room Polling
 # ---------------------
-st.button("Play Again 🔄", on_click=reset_game)
+# While it is the other player's turn, watch the room's version number and
+# only rerun the page once something actually changed.
+if room and (game.is_over() or game.player != st.session_state.mark):
+    watch_room(room, room_version)
@@ -1,5 +1,15 @@
+import uuid
+
 import streamlit as st
 
+from rps_bracket import BYE, Bracket, wins_needed
+from rps_matches import MatchStore
+from rps_predictor import Predictor
+from rps_rules import CLASSIC, RULESETS
+from rps_stats import StatsStore
+
+MATCH_POLL_SECONDS = 1.0   # how often a waiting remote player checks for changes
+
 # ------------------ Page Config ------------------
 st.set_page_config(page_title="Rock Paper Scissors", page_icon="✊", layout="centered")
 
@@ -16,18 +26,72 @@ if "p2_choice" not in st.session_state:
 if "scores" not in st.session_state:
     st.session_state.scores = {"p1": 0, "p2": 0, "draw": 0}
 
+if "mode" not in st.session_state:
+    st.session_state.mode = "2 Players"
+
+if "rules" not in st.session_state:
+    st.session_state.rules = CLASSIC.name
+
+if "predictor" not in st.session_state:
+    st.session_state.predictor = Predictor()
+
+if "names" not in st.session_state:
+    st.session_state.names = {"p1": "Player 1", "p2": "Player 2"}
+
+if "client_id" not in st.session_state:
+    st.session_state.client_id = uuid.uuid4().hex
+
+if "match" not in st.session_state:
+    st.session_state.match = None
+
+if "seat" not in st.session_state:
+    st.session_state.seat = None
+
+if "best_of" not in st.session_state:
+    st.session_state.best_of = 0          # 0 = endless rounds
+
+if "match_winner" not in st.session_state:
+    st.session_state.match_winner = None
+
+if "bracket" not in st.session_state:
+    st.session_state.bracket = None
+    st.session_state.entrants = []
+
 # ------------------ Helper Functions ------------------
+@st.cache_resource
+def get_stats_store():
+    return StatsStore()
+
+
+@st.cache_resource
+def get_match_store():
+    return MatchStore()
+
+
+@st.fragment(run_every=MATCH_POLL_SECONDS)
+def watch_match(code, seen):
+    # Runs on its own timer without blocking the page, so Leave Match
+    # still responds; reruns the whole page once the match changes.
+    if get_match_store().version(code) != seen:
+        st.rerun()
+
+
+def current_rules():
+    return RULESETS[st.session_state.rules]
+
+
 def decide_winner(p1, p2):
-    if p1 == p2:
-        return "draw"
-    rules = {
-        "Rock": "Scissors",
-        "Paper": "Rock",
-        "Scissors": "Paper"
-    }
-    if rules[p1] == p2:
-        return "p1"
-    return "p2"
+    return current_rules().decide(p1, p2)
+
+
+def move_buttons(prefix):
+    """One button per move of the current rule set; returns the move clicked."""
+    rules = current_rules()
+    chosen = None
+    for move in rules.moves:
+        if st.button(rules.label(move), key=f"{prefix}_{move.lower()}"):
+            chosen = move
+    return chosen
 
 
 def reset_round():
@@ -40,49 +104,201 @@ def reset_all():
     st.session_state.p1_choice = None
     st.session_state.p2_choice = None
     st.session_state.scores = {"p1": 0, "p2": 0, "draw": 0}
+    st.session_state.predictor = Predictor(rules=current_rules())
+    st.session_state.match = None
+    st.session_state.seat = None
+    st.session_state.match_winner = None
+    st.session_state.bracket = None
+    st.session_state.entrants = []
 
 # ------------------ UI ------------------
 st.title("✊ Rock Paper Scissors")
-st.caption("A simple 2-player game built with Streamlit")
+st.caption("A simple 2-player game built with Streamlit — or take on the computer")
 
 # ------------------ Welcome Screen ------------------
 if not st.session_state.started:
     st.info("Click **Start Game** to begin 🎮")
+    mode = st.radio("Mode", ["2 Players", "vs Computer", "Remote match", "Tournament"], horizontal=True)
+    remote = mode == "Remote match"
+    tournament = mode == "Tournament"
+    rules_name = st.selectbox("Rules", list(RULESETS), index=list(RULESETS).index(st.session_state.rules))
+    p1_input, p2_input, entrants = "", "", []
+    if tournament:
+        entrants = [name.strip() for name in st.text_area("Players (one per line)").splitlines() if name.strip()]
+        double = st.radio("Format", ["Single elimination", "Double elimination"], horizontal=True) == "Double elimination"
+    else:
+        p1_input = st.text_input("Your name" if remote else "Player 1 name", st.session_state.names["p1"])
+        p2_input = "Computer" if mode == "vs Computer" else "" if remote else st.text_input("Player 2 name", st.session_state.names["p2"])
+    best_of = 0
+    if not remote:
+        length = st.selectbox("Match length", ["Endless", "Best of 3", "Best of 5", "Best of 7"], index=1 if tournament else 0)
+        best_of = 0 if length == "Endless" else int(length.split()[-1])
+        if tournament and not best_of:
+            best_of = 1
+    match_code = None
+    if remote and st.radio("Match", ["Create a match", "Join a match"], horizontal=True) == "Join a match":
+        match_code = st.text_input("Match code").strip().upper()
     if st.button("🚀 Start Game"):
+        if tournament:
+            if len(entrants) < 2:
+                st.error("❌ A tournament needs at least 2 players.")
+                st.stop()
+            st.session_state.entrants = entrants
+            st.session_state.bracket = Bracket(len(entrants), double)
+        st.session_state.rules = rules_name
+        st.session_state.predictor = Predictor(rules=RULESETS[rules_name])
+        st.session_state.best_of = best_of
+        st.session_state.match_winner = None
+        st.session_state.scores = {"p1": 0, "p2": 0, "draw": 0}
+        if remote:
+            matches = get_match_store()
+            if match_code is None:
+                match_code = matches.create(RULESETS[rules_name])
+            elif match_code not in matches.matches:
+                st.error(f"❌ No match with code {match_code}.")
+                st.stop()
+            else:
+                # Joiners play by whatever rules the match was created with.
+                st.session_state.rules = matches.matches[match_code].rules.name
+            st.session_state.match = match_code
+            st.session_state.seat = matches.join(match_code, st.session_state.client_id, p1_input.strip() or "Player")
         st.session_state.started = True
+        st.session_state.mode = mode
+        st.session_state.names = {"p1": p1_input.strip() or "Player 1", "p2": p2_input.strip() or "Player 2"}
     st.stop()
 
+# ------------------ Remote Match ------------------
+if st.session_state.mode == "Remote match":
+    matches = get_match_store()
+    code, seat = st.session_state.match, st.session_state.seat
+    view = matches.view(code, seat)
+    other = "p2" if seat == "p1" else "p1"
+    my_name = view["names"].get(seat) or "You"
+    their_name = view["names"][other]
+
+    st.subheader(f"Match {code} · Round {view['round']}")
+    st.caption(view["rules"])
+    if seat is None:
+        st.warning("This match is full — you are watching.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"### {my_name} (you)")
+        if seat and view["my_move"] is None:
+            move = move_buttons("remote")
+            if move:
+                resolved = matches.commit(code, seat, move)
+                if resolved:
+                    get_stats_store().record_round(resolved["p1"], resolved["p2"], resolved["p1_move"],
+                                                   resolved["p2_move"], resolved["winner"])
+                st.rerun()
+        elif seat:
+            st.success(f"Choice locked: **{view['my_move']}**")
+    with col2:
+        st.markdown(f"### {their_name or 'Opponent'}")
+        if their_name is None:
+            st.warning(f"Waiting for someone to join with code **{code}**…")
+        elif view["opponent_committed"]:
+            st.info("🔒 Has locked in a choice")
+        else:
+            st.info("🤔 Choosing…")
+
+    last = view["last"]
+    if last:
+        st.divider()
+        st.subheader(f"Round {last['round']} Result")
+        st.write(f"**{last['p1']}:** {last['p1_move']}")
+        st.write(f"**{last['p2']}:** {last['p2_move']}")
+        if last["winner"] == "draw":
+            st.info("🤝 It's a Draw!")
+        else:
+            st.success(f"🎉 {last[last['winner']]} Wins!")
+
+    st.divider()
+    st.subheader("Scoreboard")
+    s1, s2, s3 = st.columns(3)
+    with s1:
+        st.metric(f"{view['names']['p1'] or 'Player 1'} Wins", view["scores"]["p1"])
+    with s2:
+        st.metric(f"{view['names']['p2'] or 'Player 2'} Wins", view["scores"]["p2"])
+    with s3:
+        st.metric("Draws", view["scores"]["draw"])
+
+    st.divider()
+    if st.button("🚪 Leave Match"):
+        matches.leave(code, st.session_state.client_id)
+        reset_all()
+        st.rerun()
+
+    # Waiting on the other player: poll the match version and only rerun
+    # the page once it changes.
+    if seat is None or view["my_move"] is not None or their_name is None:
+        watch_match(code, view["version"])
+    st.stop()
+
+# ------------------ Tournament Bracket ------------------
+bracket = st.session_state.bracket
+if bracket:
+    entrants = st.session_state.entrants
+    with st.expander("🗂️ Bracket results"):
+        played = [m for m in range(len(bracket.winner))
+                  if bracket.winner[m] >= 0 and BYE not in (bracket.slot_a[m], bracket.slot_b[m])]
+        for m in played:
+            a, b, w = bracket.slot_a[m], bracket.slot_b[m], bracket.winner[m]
+            st.write(f"{bracket.round_of[m]}: {entrants[a]} vs {entrants[b]} → **{entrants[w]}**")
+        if not played:
+            st.caption("No matches played yet.")
+    if bracket.finished() and st.session_state.match_winner is None:
+        st.success(f"🏆 Tournament champion: **{entrants[bracket.champion]}**")
+        if st.button("🧹 New Tournament"):
+            reset_all()
+            st.rerun()
+        st.stop()
+
 # ------------------ Game Interface ------------------
 st.subheader("Game Arena")
+if st.session_state.rules != CLASSIC.name:
+    st.caption(st.session_state.rules)
+
+vs_computer = st.session_state.mode == "vs Computer"
+p1_name = st.session_state.names["p1"]
+p2_name = st.session_state.names["p2"]
+if bracket:
+    if st.session_state.match_winner is None:
+        st.session_state.current_match = bracket.next_match()
+    match_id, seat_a, seat_b = st.session_state.current_match
+    p1_name, p2_name = st.session_state.entrants[seat_a], st.session_state.entrants[seat_b]
+    st.caption(f"{bracket.round_of[match_id]} · {p1_name} vs {p2_name}")
+if st.session_state.best_of:
+    st.caption(f"Best of {st.session_state.best_of}: first to {wins_needed(st.session_state.best_of)} wins takes the match.")
+
+# The computer commits to its move from your history alone, before you pick.
+if vs_computer and st.session_state.p2_choice is None:
+    st.session_state.p2_choice = st.session_state.predictor.choose()
 
 col1, col2 = st.columns(2)
 
 # Player 1
 with col1:
-    st.markdown("### Player 1")
+    st.markdown(f"### {p1_name}")
     if st.session_state.p1_choice is None:
-        if st.button("✊ Rock", key="p1_rock"):
-            st.session_state.p1_choice = "Rock"
-        if st.button("📄 Paper", key="p1_paper"):
-            st.session_state.p1_choice = "Paper"
-        if st.button("✂️ Scissors", key="p1_scissors"):
-            st.session_state.p1_choice = "Scissors"
+        st.session_state.p1_choice = move_buttons("p1")
     else:
         st.success(f"Choice locked: **{st.session_state.p1_choice}**")
 
 # Player 2
 with col2:
-    st.markdown("### Player 2")
-    if st.session_state.p1_choice is None:
-        st.warning("Waiting for Player 1…")
+    st.markdown(f"### {p2_name}")
+    if vs_computer:
+        if st.session_state.p1_choice is None:
+            st.info("🤖 Computer has locked in a choice")
+        else:
+            st.success(f"Choice locked: **{st.session_state.p2_choice}**")
+    elif st.session_state.p1_choice is None:
+        st.warning(f"Waiting for {p1_name}…")
     else:
         if st.session_state.p2_choice is None:
-            if st.button("✊ Rock", key="p2_rock"):
-                st.session_state.p2_choice = "Rock"
-            if st.button("📄 Paper", key="p2_paper"):
-                st.session_state.p2_choice = "Paper"
-            if st.button("✂️ Scissors", key="p2_scissors"):
-                st.session_state.p2_choice = "Scissors"
+            st.session_state.p2_choice = move_buttons("p2")
         else:
             st.success(f"Choice locked: **{st.session_state.p2_choice}**")
 
@@ -97,32 +313,48 @@ if st.session_state.p1_choice and st.session_state.p2_choice:
 
     winner = decide_winner(st.session_state.p1_choice, st.session_state.p2_choice)
 
-    st.write(f"**Player 1:** {st.session_state.p1_choice}")
-    st.write(f"**Player 2:** {st.session_state.p2_choice}")
+    st.write(f"**{p1_name}:** {st.session_state.p1_choice}")
+    st.write(f"**{p2_name}:** {st.session_state.p2_choice}")
 
     if not st.session_state.round_done:
         if winner == "draw":
             st.info("🤝 It's a Draw!")
             st.session_state.scores["draw"] += 1
         elif winner == "p1":
-            st.success("🎉 Player 1 Wins!")
+            st.success(f"🎉 {p1_name} Wins!")
             st.session_state.scores["p1"] += 1
         else:
-            st.success("🎉 Player 2 Wins!")
+            st.success(f"🎉 {p2_name} Wins!")
             st.session_state.scores["p2"] += 1
+        if vs_computer:
+            st.session_state.predictor.update(st.session_state.p1_choice)
+        get_stats_store().record_round(p1_name, p2_name, st.session_state.p1_choice,
+                                       st.session_state.p2_choice, winner)
+        best_of = st.session_state.best_of
+        if best_of and winner != "draw" and st.session_state.scores[winner] >= wins_needed(best_of):
+            st.session_state.match_winner = winner
+            if bracket:
+                bracket.report(match_id, seat_a if winner == "p1" else seat_b)
         st.session_state.round_done = True
     else:
         if winner == "draw":
             st.info("🤝 It's a Draw!")
         elif winner == "p1":
-            st.success("🎉 Player 1 Wins!")
+            st.success(f"🎉 {p1_name} Wins!")
         else:
-            st.success("🎉 Player 2 Wins!")
+            st.success(f"🎉 {p2_name} Wins!")
+
+    if st.session_state.match_winner:
+        match_name = p1_name if st.session_state.match_winner == "p1" else p2_name
+        st.success(f"🏆 {match_name} wins the match!")
 
-    if st.button("🔁 Play Next Round"):
+    if st.button("▶️ Next Match" if st.session_state.match_winner else "🔁 Play Next Round"):
         st.session_state.p1_choice = None
         st.session_state.p2_choice = None
         st.session_state.round_done = False
+        if st.session_state.match_winner:
+            st.session_state.match_winner = None
+            st.session_state.scores = {"p1": 0, "p2": 0, "draw": 0}
 
 # ------------------ Scoreboard ------------------
 st.divider()
@@ -130,12 +362,44 @@ st.subheader("Scoreboard")
 
 s1, s2, s3 = st.columns(3)
 with s1:
-    st.metric("Player 1 Wins", st.session_state.scores["p1"])
+    st.metric(f"{p1_name} Wins", st.session_state.scores["p1"])
 with s2:
-    st.metric("Player 2 Wins", st.session_state.scores["p2"])
+    st.metric(f"{p2_name} Wins", st.session_state.scores["p2"])
 with s3:
     st.metric("Draws", st.session_state.scores["draw"])
 
+# ------------------ All-time Stats ------------------
+st.subheader("All-time Stats")
+
+store = get_stats_store()
+moves = current_rules().moves
+rows = []
+for name in dict.fromkeys((p1_name, p2_name)):
+    stats = store.player(name)
+    if stats:
+        rounds = stats["rounds"]
+        rows.append({
+            "Player": name,
+            "Rounds": rounds,
+            "Win rate": f"{stats['wins'] / rounds:.0%}",
+            "Draws": stats["draws"],
+            " / ".join(moves): " / ".join(f"{stats['moves'].get(move, 0) / rounds:.0%}" for move in moves),
+            "Streak": stats["streak"],
+            "Best streak": stats["best_streak"],
+        })
+if rows:
+    st.table(rows)
+else:
+    st.caption("No rounds recorded for these players yet.")
+
+with st.expander("🏅 Leaderboard"):
+    leaders = store.leaderboard()
+    if leaders:
+        st.table([{"Player": p["player"], "Rounds": p["rounds"], "Win rate": f"{p['wins'] / p['rounds']:.0%}",
+                   "Best streak": p["best_streak"]} for p in leaders])
+    else:
+        st.caption("Nobody has played yet.")
+
 # ------------------ Reset ------------------
 st.divider()
 if st.button("🧹 Reset Game & Scores"):
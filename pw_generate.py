@@ -0,0 +1,169 @@
+import csv
+import io
+import random
+import secrets
+import string
+import sys
+import time
+
+import numpy as np
+
+NEWLINE = ord("\n")
+CHUNK = 50_000          # passwords per write when streaming to a file
+FORMATS = {"txt": "text/plain", "csv": "text/csv"}
+# Spreadsheets evaluate a cell starting with one of the first six as a
+# formula; a leading ' is escaped too, so unescaping is never ambiguous.
+ESCAPED_PREFIXES = ("=", "+", "-", "@", "\t", "\r", "'")
+
+
+# ------------------ Batch Generation ------------------
+def _alphabet_table(alphabet):
+    if not alphabet:
+        raise ValueError("the alphabet is empty")
+    if "\n" in alphabet:
+        raise ValueError("the alphabet cannot contain a newline")
+    try:
+        table = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+    except UnicodeEncodeError:
+        raise ValueError("the alphabet must be ASCII") from None
+    if len(table) > 256:
+        raise ValueError("the alphabet has more than 256 characters")
+    return table
+
+
+def random_indices(n, size):
+    """``n`` uniform indices in ``range(size)`` from the OS CSPRNG.
+
+    Random bytes are fetched in large batches with ``secrets.token_bytes``.
+    A byte is only kept if it falls below the largest multiple of ``size``
+    that fits in a byte, so ``byte % size`` is unbiased. Rejected bytes are
+    dropped with one NumPy mask instead of a per-character retry loop.
+    """
+    limit = 256 - 256 % size
+    accept = limit / 256
+    out = np.empty(n, dtype=np.uint8)
+    filled = 0
+    while filled < n:
+        want = n - filled
+        # Ask for enough bytes that one draw almost always suffices.
+        buf = np.frombuffer(secrets.token_bytes(int(want / accept * 1.05) + 64), dtype=np.uint8)
+        kept = buf[buf < limit][:want]
+        out[filled:filled + len(kept)] = kept
+        filled += len(kept)
+    return out % size
+
+
+def _lines(count, length, table):
+    # count × (length + 1) byte matrix, last column a newline.
+    grid = np.empty((count, length + 1), dtype=np.uint8)
+    grid[:, :length] = table[random_indices(count * length, len(table))].reshape(count, length)
+    grid[:, length] = NEWLINE
+    return grid.tobytes()
+
+
+def generate_batch(count, length, alphabet):
+    """``count`` passwords of ``length`` characters drawn from ``alphabet``.
+
+    All characters come from one CSPRNG draw. They are written into a
+    ``count × (length + 1)`` byte matrix whose last column is a newline,
+    so the whole batch decodes with a single ``bytes.decode``/``split``.
+    """
+    return _lines(count, length, _alphabet_table(alphabet)).decode("ascii").split("\n")[:-1]
+
+
+def make_batch(count, length, alphabet):
+    """Like ``generate_batch``, but ``alphabet`` may also be a ``pw_policy.Policy``."""
+    if isinstance(alphabet, str):
+        return generate_batch(count, length, alphabet)
+    return alphabet.generate(count, length)
+
+
+# ------------------ Streaming Export ------------------
+def csv_escape(password):
+    """``password`` with a leading ``'`` added if it starts with ESCAPED_PREFIXES."""
+    return "'" + password if password.startswith(ESCAPED_PREFIXES) else password
+
+
+def iter_chunks(count, length, alphabet, fmt="txt", chunk=CHUNK, issued=None):
+    """Yield ``(passwords_so_far, data)`` byte chunks of a ``fmt`` export.
+
+    Each chunk holds at most ``chunk`` passwords and is generated only when
+    the consumer asks for it, so memory stays flat however large ``count``
+    is. Plain text is written straight from the byte matrix. CSV adds a
+    header and an index column and quotes passwords with ``"`` or ``,``.
+    A CSV password starting with ``=``, ``+``, ``-``, ``@``, a tab, a
+    carriage return or ``'`` is written with an extra leading ``'``, so
+    Excel and Sheets show it as text instead of evaluating a formula. When
+    reading the file any other way, strip exactly one leading ``'`` from
+    every cell that has one; the plain-text export is never escaped.
+    With ``issued`` (a ``pw_unique.IssuedStore``) every password is one
+    that store has never handed out before. ``alphabet`` may be a
+    ``pw_policy.Policy`` instead of a string.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}")
+    table = _alphabet_table(alphabet) if isinstance(alphabet, str) else None
+    if fmt == "csv":
+        yield 0, b"index,password\r\n"
+    for start in range(0, count, chunk):
+        n = min(chunk, count - start)
+        if issued is None and table is not None:
+            data = _lines(n, length, table)
+        else:
+            passwords = issued.generate(n, length, alphabet) if issued else make_batch(n, length, alphabet)
+            data = "".join(p + "\n" for p in passwords).encode("ascii")
+        if fmt == "csv":
+            out = io.StringIO()
+            passwords = map(csv_escape, data.decode("ascii").split("\n")[:-1])
+            csv.writer(out).writerows(enumerate(passwords, start + 1))
+            data = out.getvalue().encode("ascii")
+        yield start + n, data
+
+
+def export(path, count, length, alphabet, fmt="txt", chunk=CHUNK, progress=None, issued=None):
+    """Stream ``count`` passwords into ``path``; ``progress(done, count)`` runs after each chunk."""
+    with open(path, "wb") as f:
+        for done, data in iter_chunks(count, length, alphabet, fmt, chunk, issued):
+            f.write(data)
+            if progress:
+                progress(done, count)
+
+
+# ------------------ Benchmark ------------------
+def _random_choice(length, characters):
+    # The generator Password_Generator.py used before: one random.choice per character.
+    return ''.join(random.choice(characters) for _ in range(length))
+
+
+def benchmark(count=100_000, length=32, alphabet=None):
+    alphabet = alphabet or string.ascii_letters + string.digits + string.punctuation
+    start = time.perf_counter()
+    for _ in range(count):
+        _random_choice(length, alphabet)
+    t_choice = time.perf_counter() - start
+    start = time.perf_counter()
+    generate_batch(count, length, alphabet)
+    t_batch = time.perf_counter() - start
+    print(f"{count:,} passwords of length {length}: random.choice {t_choice:.2f} s "
+          f"({count / t_choice:,.0f}/s), batched CSPRNG {t_batch:.3f} s ({count / t_batch:,.0f}/s)")
+
+
+def main(argv):
+    if argv and argv[0] == "export":
+        # python pw_generate.py export PATH [count] [length]
+        path = argv[1]
+        count = int(argv[2]) if len(argv) > 2 else 1_000_000
+        length = int(argv[3]) if len(argv) > 3 else 32
+        alphabet = string.ascii_letters + string.digits + string.punctuation
+        start = time.perf_counter()
+        export(path, count, length, alphabet, "csv" if path.endswith(".csv") else "txt")
+        elapsed = time.perf_counter() - start
+        print(f"wrote {count:,} passwords to {path} in {elapsed:.2f} s ({count / elapsed:,.0f}/s)")
+        return
+    count = int(argv[0]) if argv else 100_000
+    length = int(argv[1]) if len(argv) > 1 else 32
+    benchmark(count, length)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,230 @@
+import hashlib
+import math
+import os
+import secrets
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+from pw_generate import make_batch
+
+ISSUED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pw_issued.bin")
+
+# magic, kind, bits, hashes, count, key
+HEADER = struct.Struct("<4sBQQQ16s")
+MAGIC = b"PWU1"
+EXACT, BLOOM = 0, 1
+DIGEST_SIZE = 16
+EXACT_LIMIT = 100_000
+
+
+def bloom_size(capacity, error_rate):
+    """``(bits, hashes)`` for ``capacity`` entries at ``error_rate`` false positives."""
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    bits = (bits + 63) // 64 * 64
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+# ------------------ Bloom Filter ------------------
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit digests.
+
+    The two 64-bit halves of each digest drive double hashing
+    (``h1 + i * h2 mod bits``), so testing or adding a whole batch is a
+    handful of NumPy operations on a ``(batch, hashes)`` position matrix.
+    ``bits`` can be a ``np.memmap``, so the filter lives in the page cache
+    rather than in the process.
+    """
+
+    def __init__(self, bits, hashes, array=None):
+        self.size = bits
+        self.hashes = hashes
+        self.bits = np.zeros(bits // 8, dtype=np.uint8) if array is None else array
+
+    def _positions(self, digests):
+        halves = np.frombuffer(digests, dtype=np.uint64).reshape(-1, 2)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        return (halves[:, :1] + steps * (halves[:, 1:] | np.uint64(1))) % np.uint64(self.size)
+
+    def contains(self, digests):
+        """Boolean array: which of the concatenated ``digests`` may have been added."""
+        pos = self._positions(digests)
+        hit = self.bits[pos >> np.uint64(3)] & (np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8))
+        return hit.all(axis=1)
+
+    def add(self, digests):
+        pos = np.sort(self._positions(digests).ravel())
+        index = pos >> np.uint64(3)
+        masks = np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8)
+        # Several positions can share a byte: OR their masks together first,
+        # since a fancy-indexed |= would keep only one of them.
+        index, starts = np.unique(index, return_index=True)
+        self.bits[index] |= np.bitwise_or.reduceat(masks, starts)
+
+
+# ------------------ Issued Passwords ------------------
+class IssuedStore:
+    """Every password ever issued, as keyed 128-bit BLAKE2b digests.
+
+    Up to ``exact_limit`` entries the digests are kept in a set and checked
+    exactly. Beyond that they move into a Bloom filter sized for
+    ``capacity`` entries at ``error_rate``, stored in ``path`` and
+    memory-mapped, so memory stays bounded at tens of millions of entries.
+    A Bloom false positive only makes a fresh password look used, so it
+    gets replaced. A repeat is never let through.
+
+    Plain passwords are never written to disk. The hash key is random per
+    store.
+    """
+
+    def __init__(self, path=ISSUED_PATH, capacity=50_000_000, error_rate=1e-9, exact_limit=EXACT_LIMIT):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.exact_limit = exact_limit
+        self.exact = set()
+        self.bloom = None
+        self.count = 0
+        self.lock = threading.RLock()
+        if os.path.exists(path):
+            self._load()
+        else:
+            self.key = secrets.token_bytes(16)
+            self._save()
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            magic, kind, bits, hashes, self.count, self.key = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not an issued-password store")
+            if kind == EXACT:
+                data = f.read()
+                self.exact = {data[i:i + DIGEST_SIZE] for i in range(0, len(data), DIGEST_SIZE)}
+                return
+        array = np.memmap(self.path, dtype=np.uint8, mode="r+", offset=HEADER.size, shape=(bits // 8,))
+        self.bloom = BloomFilter(bits, hashes, array)
+
+    def _header(self):
+        kind = BLOOM if self.bloom else EXACT
+        bits, hashes = (self.bloom.size, self.bloom.hashes) if self.bloom else (0, 0)
+        return HEADER.pack(MAGIC, kind, bits, hashes, self.count, self.key)
+
+    def save(self):
+        with self.lock:
+            self._save()
+
+    def _save(self):
+        if self.bloom is not None:
+            self.bloom.bits.flush()
+            with open(self.path, "r+b") as f:
+                f.write(self._header())
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._header())
+            f.write(b"".join(self.exact))
+        os.replace(tmp, self.path)
+
+    def _to_bloom(self):
+        # Past exact_limit: lay out a memory-mapped filter and move the set
+        # into it. The file only replaces the store once it is complete,
+        # with a Bloom header, so the store on disk is never half-migrated.
+        bits, hashes = bloom_size(max(self.capacity, len(self.exact)), self.error_rate)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.truncate(HEADER.size + bits // 8)
+        array = np.memmap(tmp, dtype=np.uint8, mode="r+", offset=HEADER.size, shape=(bits // 8,))
+        bloom = BloomFilter(bits, hashes, array)
+        if self.exact:
+            bloom.add(b"".join(self.exact))
+        array.flush()
+        with open(tmp, "r+b") as f:
+            f.write(HEADER.pack(MAGIC, BLOOM, bits, hashes, self.count, self.key))
+        os.replace(tmp, self.path)
+        self.bloom, self.exact = bloom, set()
+
+    def digests(self, passwords):
+        blake = hashlib.blake2b
+        return [blake(p.encode(), digest_size=DIGEST_SIZE, key=self.key).digest() for p in passwords]
+
+    def admit(self, passwords):
+        """Record and return the passwords that were never issued before, in order.
+
+        Repeats inside ``passwords`` are dropped too: only the first copy is kept.
+        """
+        digests = self.digests(passwords)
+        with self.lock:
+            return self._admit(passwords, digests)
+
+    def _admit(self, passwords, digests):
+        seen, fresh, fresh_digests = set(), [], []
+        if self.bloom is None:
+            for p, d in zip(passwords, digests):
+                if d not in self.exact and d not in seen:
+                    seen.add(d)
+                    fresh.append(p)
+                    fresh_digests.append(d)
+            self.exact.update(fresh_digests)
+            self.count += len(fresh)
+            if self.count > self.exact_limit:
+                self._to_bloom()
+            return fresh
+        if not digests:
+            return []
+        blob = b"".join(digests)
+        keys = np.frombuffer(blob, dtype=f"V{DIGEST_SIZE}")
+        keep = np.zeros(len(keys), dtype=bool)
+        keep[np.unique(keys, return_index=True)[1]] = True
+        keep &= ~self.bloom.contains(blob)
+        index = np.flatnonzero(keep)
+        if len(index):
+            self.bloom.add(keys[index].tobytes())
+        self.count += len(index)
+        return [passwords[i] for i in index]
+
+    def generate(self, count, length, alphabet, max_rounds=100):
+        """``count`` passwords that have never been issued, recorded as issued.
+
+        ``alphabet`` is a string or a ``pw_policy.Policy``.
+        """
+        out = []
+        for _ in range(max_rounds):
+            need = count - len(out)
+            if not need:
+                return out
+            out += self.admit(make_batch(need, length, alphabet))
+        raise ValueError("could not find enough unused passwords; use a longer length or a larger alphabet")
+
+    def false_positive_rate(self):
+        """Estimated chance that a fresh password is rejected as already issued."""
+        if self.bloom is None:
+            return 0.0
+        k, m = self.bloom.hashes, self.bloom.size
+        return (1 - math.exp(-k * self.count / m)) ** k
+
+
+# ------------------ Benchmark ------------------
+def main(argv):
+    import string
+    import tempfile
+    count = int(argv[0]) if argv else 2_000_000
+    batch = 100_000
+    path = os.path.join(tempfile.mkdtemp(), "issued.bin")
+    store = IssuedStore(path, capacity=count, error_rate=1e-9)
+    alphabet = string.ascii_letters + string.digits
+    start = time.perf_counter()
+    for done in range(0, count, batch):
+        store.generate(min(batch, count - done), 16, alphabet)
+    store.save()
+    elapsed = time.perf_counter() - start
+    print(f"{store.count:,} unique passwords in {elapsed:.2f} s ({store.count / elapsed:,.0f}/s); "
+          f"filter {os.path.getsize(path) / 1e6:.1f} MB, est. false positive rate {store.false_positive_rate():.1e}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,121 @@
+import math
+import mmap
+import os
+import secrets
+import struct
+import sys
+import time
+
+import numpy as np
+
+WORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pw_words.bin")
+
+# magic, word count; then (count + 1) uint32 offsets, then the UTF-8 words back to back.
+HEADER = struct.Struct("<4sI")
+MAGIC = b"PWW1"
+MIN_WORDS = 7776        # a standard diceware list (6**5); about 12.9 bits per word
+
+
+# ------------------ Building ------------------
+def parse(lines):
+    """Words from a text wordlist, one per line, in order and without repeats.
+
+    Diceware lists (``11111<TAB>word``) work too: only the last field of
+    each line is used.
+    """
+    words = {}
+    for line in lines:
+        fields = line.split()
+        if fields:
+            words.setdefault(fields[-1], None)
+    return list(words)
+
+
+def build(words, path=WORDS_PATH, min_words=MIN_WORDS):
+    """Write ``words`` as an offset-indexed binary wordlist; returns the count."""
+    encoded = [w.encode("utf-8") for w in words]
+    if len(encoded) < min_words:
+        raise ValueError(f"the wordlist has {len(encoded):,} distinct words; at least {min_words:,} are needed")
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(w) for w in encoded], out=offsets[1:])
+    offsets += HEADER.size + offsets.nbytes
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(encoded)))
+        f.write(offsets.astype("<u4").tobytes())
+        f.write(b"".join(encoded))
+    os.replace(tmp, path)
+    return len(encoded)
+
+
+# ------------------ Word List ------------------
+class WordList:
+    """A binary wordlist opened with ``mmap``.
+
+    Opening reads only the 8-byte header. ``offsets`` is a NumPy view
+    straight onto the mapped file, so ``words[i]`` slices two offsets and
+    decodes one word: O(1), and nothing is parsed into Python strings up
+    front. The OS pages the file in as words are touched.
+    """
+
+    def __init__(self, path=WORDS_PATH, min_words=MIN_WORDS):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a binary wordlist")
+        if self.count < min_words:
+            self.map.close()
+            raise ValueError(f"{path} has only {self.count:,} words; rebuild it from a list of at least {min_words:,}")
+        self.offsets = np.frombuffer(self.map, dtype="<u4", count=self.count + 1, offset=HEADER.size)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return self.map[int(self.offsets[i]):int(self.offsets[i + 1])].decode("utf-8")
+
+    def bits_per_word(self):
+        return math.log2(self.count)
+
+    def passphrase(self, words=6, separator=" ", capitalize=False):
+        """``words`` words picked uniformly with ``secrets.randbelow``."""
+        picked = [self[secrets.randbelow(self.count)] for _ in range(words)]
+        if capitalize:
+            picked = [w[:1].upper() + w[1:] for w in picked]
+        return separator.join(picked)
+
+    def close(self):
+        # Drop the view onto the map first, or mmap refuses to close.
+        self.offsets = None
+        self.map.close()
+
+
+# ------------------ Benchmark ------------------
+def main(argv):
+    if len(argv) >= 2 and argv[0] == "build":
+        # python pw_words.py build WORDLIST.txt [pw_words.bin]
+        with open(argv[1], encoding="utf-8") as f:
+            try:
+                count = build(parse(f), argv[2] if len(argv) > 2 else WORDS_PATH)
+            except ValueError as e:
+                sys.exit(f"error: {e}")
+        print(f"built {count:,} words")
+        return
+    path = argv[0] if argv else WORDS_PATH
+    start = time.perf_counter()
+    words = WordList(path)
+    opened = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in np.random.default_rng().integers(0, len(words), 1_000_000):
+        words[i]
+    lookups = time.perf_counter() - start
+    print(f"{len(words):,} words ({words.bits_per_word():.1f} bits each): opened in {opened * 1e3:.2f} ms, "
+          f"{1_000_000 / lookups:,.0f} random lookups/s")
+    print("sample:", words.passphrase())
+    words.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
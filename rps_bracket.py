@@ -0,0 +1,256 @@
+import random
+import sys
+import time
+from array import array
+from collections import deque
+
+from rps_predictor import MOVES, Predictor
+from rps_rules import CLASSIC
+
+PENDING = -1
+BYE = -2
+ELIMINATED = -1
+
+
+def seed_order(size):
+    """Bracket positions for seeds 0..size-1 so the top seeds meet last."""
+    order = [0]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [x for seed in order for x in (seed, n - 1 - seed)]
+    return order
+
+
+# ------------------ Bracket ------------------
+class Bracket:
+    """Single- or double-elimination bracket for ``players`` entrants (ids 0..n-1).
+
+    The whole match graph is laid out up front in flat int arrays: the two
+    slots of every match, its winner, and where its winner and loser go next
+    (``match * 2 + side``, or -1). Reporting a result writes at most two
+    slots and queues any match that just became playable, so each update is
+    O(1) and the bracket state is a few ints per match. Byes fill the empty
+    seeds and are advanced automatically.
+
+    Double elimination uses a losers' bracket fed by each winners' round
+    and a grand final with a reset match if the losers' champion wins.
+    """
+
+    def __init__(self, players, double=False):
+        if players < 2:
+            raise ValueError("a bracket needs at least 2 players")
+        self.players = players
+        self.double = double
+        size = 1
+        while size < players:
+            size *= 2
+        self.size = size
+        self.slot_a = array("i")
+        self.slot_b = array("i")
+        self.winner = array("i")
+        self.winner_to = array("i")
+        self.loser_to = array("i")
+        self.round_of = []              # label per match, for display
+        self.ready = deque()
+        self.champion = None
+        self.results = 0
+
+        wb = self._build_winners()
+        self.final = wb[-1][0]
+        if double:
+            self._build_losers(wb)
+
+        for pos, seed in enumerate(seed_order(size)):
+            match, side = wb[0][pos // 2], pos % 2
+            self._fill(match, side, seed if seed < players else BYE)
+
+    def _add(self, label, count):
+        first = len(self.winner)
+        for _ in range(count):
+            for arr in (self.slot_a, self.slot_b, self.winner, self.winner_to, self.loser_to):
+                arr.append(PENDING)
+            self.round_of.append(label)
+        return list(range(first, first + count))
+
+    def _build_winners(self):
+        rounds = []
+        count, r = self.size // 2, 1
+        while count:
+            rounds.append(self._add(f"Round {r}" if self.double else self._round_name(count, r), count))
+            count //= 2
+            r += 1
+        for r in range(len(rounds) - 1):
+            for j, m in enumerate(rounds[r]):
+                self.winner_to[m] = rounds[r + 1][j // 2] * 2 + j % 2
+        return rounds
+
+    @staticmethod
+    def _round_name(count, r):
+        return {1: "Final", 2: "Semi-final", 4: "Quarter-final"}.get(count, f"Round {r}")
+
+    def _build_losers(self, wb):
+        levels = len(wb)
+        grand = self._add("Grand final", 1)[0]
+        reset = self._add("Grand final (reset)", 1)[0]
+        self.grand, self.reset = grand, reset
+        self.winner_to[self.final] = grand * 2
+
+        if levels == 1:
+            self.loser_to[self.final] = grand * 2 + 1
+            return
+
+        # Losers' round 1: pairs of winners'-round-1 losers.
+        prev = self._add("Losers round 1", self.size // 4)
+        for j, m in enumerate(wb[0]):
+            self.loser_to[m] = prev[j // 2] * 2 + j % 2
+        k = 2
+        for r in range(1, levels):
+            # Major round: losers' survivors meet the losers of winners' round r+1,
+            # fed in reverse order to postpone rematches.
+            major = self._add(f"Losers round {k}", len(prev))
+            for j, m in enumerate(prev):
+                self.winner_to[m] = major[j] * 2
+            for j, m in enumerate(wb[r]):
+                self.loser_to[m] = major[len(major) - 1 - j] * 2 + 1
+            k += 1
+            if len(major) == 1:
+                self.winner_to[major[0]] = grand * 2 + 1
+                break
+            # Minor round: survivors pair off among themselves.
+            prev = self._add(f"Losers round {k}", len(major) // 2)
+            for j, m in enumerate(major):
+                self.winner_to[m] = prev[j // 2] * 2 + j % 2
+            k += 1
+
+    # ------------------ Updates ------------------
+    def _fill(self, match, side, player):
+        (self.slot_b if side else self.slot_a)[match] = player
+        a, b = self.slot_a[match], self.slot_b[match]
+        if a == PENDING or b == PENDING:
+            return
+        if a == BYE or b == BYE:
+            # Byes never play: the real player (or a bye) walks through.
+            self._resolve(match, b if a == BYE else a, BYE)
+        else:
+            self.ready.append(match)
+
+    def _resolve(self, match, winner, loser):
+        self.winner[match] = winner
+        if self.double and match == self.grand:
+            if winner == self.slot_a[match] or winner == BYE:
+                self.champion = winner
+            else:
+                self._fill(self.reset, 0, self.slot_a[match])
+                self._fill(self.reset, 1, self.slot_b[match])
+            return
+        if (self.double and match == self.reset) or (not self.double and match == self.final):
+            self.champion = winner
+            return
+        target = self.winner_to[match]
+        self._fill(target // 2, target % 2, winner)
+        target = self.loser_to[match]
+        if target != ELIMINATED:
+            self._fill(target // 2, target % 2, loser)
+
+    def next_match(self):
+        """``(match, player_a, player_b)`` for the next playable match, or None."""
+        if not self.ready:
+            return None
+        m = self.ready[0]
+        return m, self.slot_a[m], self.slot_b[m]
+
+    def report(self, match, winner):
+        """Record that ``winner`` (a player id) won ``match``."""
+        a, b = self.slot_a[match], self.slot_b[match]
+        if winner not in (a, b) or self.winner[match] != PENDING:
+            raise ValueError(f"{winner} cannot win match {match}")
+        self.ready.remove(match)
+        self.results += 1
+        self._resolve(match, winner, b if winner == a else a)
+
+    def finished(self):
+        return self.champion is not None
+
+
+# ------------------ Best-of-N ------------------
+def wins_needed(best_of):
+    return best_of // 2 + 1
+
+
+def play_best_of(best_of, play_round, max_rounds=1000):
+    """Play rounds until one side has a majority of ``best_of``; draws replay.
+
+    ``play_round()`` returns "p1", "p2" or "draw". Returns the match winner.
+    """
+    need = wins_needed(best_of)
+    wins = {"p1": 0, "p2": 0}
+    for _ in range(max_rounds):
+        result = play_round()
+        if result != "draw":
+            wins[result] += 1
+            if wins[result] == need:
+                return result
+    return "p1" if wins["p1"] >= wins["p2"] else "p2"
+
+
+# ------------------ Bots ------------------
+class Bot:
+    """A headless player: random, biased towards one move, or predictive."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.style = rng.choice(("random", "biased", "predictor"))
+        self.favourite = rng.randrange(3)
+        self.predictor = Predictor(order=1, rng=rng) if self.style == "predictor" else None
+
+    def choose(self):
+        if self.style == "biased":
+            return MOVES[self.favourite] if self.rng.random() < 0.6 else self.rng.choice(MOVES)
+        if self.style == "predictor":
+            return self.predictor.choose()
+        return self.rng.choice(MOVES)
+
+    def observe(self, opponent_move):
+        if self.predictor:
+            self.predictor.update(opponent_move)
+
+
+def bot_round(a, b):
+    ma, mb = a.choose(), b.choose()
+    a.observe(mb)
+    b.observe(ma)
+    return CLASSIC.decide(ma, mb)
+
+
+def run_bots(players=10_000, double=False, best_of=3, seed=None):
+    """Resolve a whole bracket of bot players headless; returns (bracket, rounds)."""
+    rng = random.Random(seed)
+    bots = [Bot(rng) for _ in range(players)]
+    bracket = Bracket(players, double)
+    rounds = 0
+    while not bracket.finished():
+        match, a, b = bracket.next_match()
+
+        def play_round():
+            nonlocal rounds
+            rounds += 1
+            return bot_round(bots[a], bots[b])
+
+        bracket.report(match, a if play_best_of(best_of, play_round) == "p1" else b)
+    return bracket, rounds
+
+
+def main(argv):
+    players = int(argv[0]) if argv else 10_000
+    best_of = int(argv[1]) if len(argv) > 1 else 3
+    for double in (False, True):
+        start = time.perf_counter()
+        bracket, rounds = run_bots(players, double, best_of)
+        elapsed = time.perf_counter() - start
+        kind = "double" if double else "single"
+        print(f"{kind}-elimination, {players:,} bots, best of {best_of}: {bracket.results:,} matches, "
+              f"{rounds:,} rounds in {elapsed:.2f} s; champion #{bracket.champion}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
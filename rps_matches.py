@@ -0,0 +1,112 @@
+import random
+import string
+import threading
+
+from rps_rules import CLASSIC
+
+CODE_LENGTH = 4
+
+
+# ------------------ Matches ------------------
+class Match:
+    def __init__(self, rules=CLASSIC):
+        self.rules = rules
+        self.players = {"p1": None, "p2": None}    # seat -> (client_id, name)
+        self.pending = {"p1": None, "p2": None}    # hidden commits for this round
+        self.scores = {"p1": 0, "p2": 0, "draw": 0}
+        self.last = None                           # last resolved round
+        self.round = 1
+        self.version = 0
+        self.lock = threading.Lock()
+
+
+class MatchStore:
+    """Shared store of two-player matches keyed by match code.
+
+    Each player commits a move without seeing the other's; the round
+    resolves inside the match lock as soon as the second commit lands.
+    ``view`` never reveals the opponent's pending move, only whether they
+    have committed. ``version`` goes up on every change so clients can poll
+    it instead of re-rendering.
+    """
+
+    def __init__(self):
+        self.matches = {}
+        self.lock = threading.Lock()
+
+    def create(self, rules=CLASSIC):
+        with self.lock:
+            while True:
+                code = "".join(random.choices(string.ascii_uppercase, k=CODE_LENGTH))
+                if code not in self.matches:
+                    self.matches[code] = Match(rules)
+                    return code
+
+    def join(self, code, client_id, name):
+        """Seat a player; returns "p1", "p2" or None if the match is full."""
+        match = self.matches[code]
+        with match.lock:
+            for seat, player in match.players.items():
+                if player and player[0] == client_id:
+                    return seat
+            for seat, player in match.players.items():
+                if player is None:
+                    match.players[seat] = (client_id, name)
+                    match.version += 1
+                    return seat
+            return None
+
+    def leave(self, code, client_id):
+        """Free ``client_id``'s seat, and any move it left pending, so someone else can join."""
+        match = self.matches[code]
+        with match.lock:
+            for seat, player in match.players.items():
+                if player and player[0] == client_id:
+                    match.players[seat] = None
+                    match.pending[seat] = None
+                    match.version += 1
+
+    def version(self, code):
+        return self.matches[code].version
+
+    def commit(self, code, seat, move):
+        """Lock in ``seat``'s move for the current round.
+
+        Returns the resolved round as a dict if this commit completed it,
+        otherwise None.
+        """
+        match = self.matches[code]
+        with match.lock:
+            if match.pending[seat] is not None:
+                return None
+            match.pending[seat] = move
+            match.version += 1
+            p1, p2 = match.pending["p1"], match.pending["p2"]
+            if p1 is None or p2 is None:
+                return None
+            winner = match.rules.decide(p1, p2)
+            match.scores[winner] += 1
+            match.last = {
+                "round": match.round,
+                "p1": match.players["p1"][1], "p2": match.players["p2"][1],
+                "p1_move": p1, "p2_move": p2, "winner": winner,
+            }
+            match.pending = {"p1": None, "p2": None}
+            match.round += 1
+            return dict(match.last)
+
+    def view(self, code, seat):
+        """What ``seat`` is allowed to see: its own commit, not the opponent's."""
+        match = self.matches[code]
+        other = "p2" if seat == "p1" else "p1"
+        with match.lock:
+            return {
+                "version": match.version,
+                "rules": match.rules.name,
+                "round": match.round,
+                "names": {s: p[1] if p else None for s, p in match.players.items()},
+                "my_move": match.pending.get(seat),
+                "opponent_committed": match.pending[other] is not None,
+                "scores": dict(match.scores),
+                "last": dict(match.last) if match.last else None,
+            }
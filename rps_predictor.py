@@ -0,0 +1,55 @@
+import random
+from array import array
+
+from rps_rules import CLASSIC
+
+# ------------------ Moves ------------------
+MOVES = CLASSIC.moves
+
+
+# ------------------ Predictor ------------------
+class Predictor:
+    """Predicts a player's next move from n-gram statistics of their history.
+
+    One fixed-size count table per context length 0..``order``: for a rule
+    set with ``m`` moves, table ``n`` has ``m**n`` rows (the last n moves,
+    base m) of m counters. Each round
+    bumps one counter per table and shifts the rolling contexts, so an
+    update costs O(order) no matter how many rounds have been played, and
+    memory never grows. Prediction uses the longest context that has been
+    seen before.
+    """
+
+    def __init__(self, order=3, rng=None, rules=CLASSIC):
+        self.order = order
+        self.rules = rules
+        self.m = m = rules.n
+        self.tables = [array("I", [0]) * (m ** n * m) for n in range(order + 1)]
+        self.contexts = [0] * (order + 1)
+        self.rounds = 0
+        self.rng = rng or random.Random()
+
+    def predict(self):
+        """Most likely next move index, or a random one with no data."""
+        m = self.m
+        for n in range(min(self.order, self.rounds), -1, -1):
+            row = self.contexts[n] * m
+            counts = self.tables[n][row:row + m]
+            best = max(counts)
+            if best:
+                return self.rng.choice([i for i in range(m) if counts[i] == best])
+        return self.rng.randrange(m)
+
+    def choose(self):
+        """The computer's move: whatever beats the predicted move."""
+        return self.rules.moves[self.rules.counters[self.predict()]]
+
+    def update(self, move):
+        i = self.rules.index[move]
+        m = self.m
+        for n in range(self.order + 1):
+            if self.rounds >= n:
+                self.tables[n][self.contexts[n] * m + i] += 1
+            if n:
+                self.contexts[n] = (self.contexts[n] * m + i) % m ** n
+        self.rounds += 1
@@ -0,0 +1,83 @@
+# ------------------ Outcomes ------------------
+DRAW, P1, P2 = 0, 1, 2
+OUTCOMES = ("draw", "p1", "p2")
+
+
+# ------------------ Rule Sets ------------------
+class RuleSet:
+    """A set of moves and who beats whom, compiled into an N×N outcome matrix.
+
+    ``matrix[a * n + b]`` is DRAW, P1 or P2 for move index ``a`` against
+    ``b``. It is built once when the rule set is created, so deciding a
+    round is two dict lookups and one index into a bytes object.
+    """
+
+    def __init__(self, name, beats, emoji=None):
+        self.name = name
+        self.moves = tuple(beats)
+        self.n = len(self.moves)
+        self.index = {move: i for i, move in enumerate(self.moves)}
+        self.emoji = emoji or {}
+
+        matrix = bytearray(self.n * self.n)
+        for move, beaten in beats.items():
+            a = self.index[move]
+            for other in beaten:
+                b = self.index[other]
+                if matrix[a * self.n + b] == P2:
+                    raise ValueError(f"{move} and {other} cannot both beat each other")
+                matrix[a * self.n + b] = P1
+                matrix[b * self.n + a] = P2
+        for a in range(self.n):
+            for b in range(self.n):
+                if a != b and matrix[a * self.n + b] == DRAW:
+                    raise ValueError(f"no rule between {self.moves[a]} and {self.moves[b]}")
+        self.matrix = bytes(matrix)
+        # counters[i]: the first move that beats move i.
+        self.counters = tuple(
+            next(j for j in range(self.n) if self.matrix[j * self.n + i] == P1)
+            for i in range(self.n)
+        )
+
+    def outcome(self, a, b):
+        """Outcome code for move indices ``a`` vs ``b``."""
+        return self.matrix[a * self.n + b]
+
+    def decide(self, p1, p2):
+        """"p1", "p2" or "draw" for two move names."""
+        return OUTCOMES[self.matrix[self.index[p1] * self.n + self.index[p2]]]
+
+    def label(self, move):
+        emoji = self.emoji.get(move)
+        return f"{emoji} {move}" if emoji else move
+
+
+def cyclic(name, moves, emoji=None):
+    """Balanced rule set for an odd number of moves: each move beats the
+    (N-1)/2 moves that follow it in ``moves``, wrapping around."""
+    n = len(moves)
+    if n < 3 or n % 2 == 0:
+        raise ValueError("a cyclic rule set needs an odd number of moves, at least 3")
+    beats = {move: [moves[(i + k) % n] for k in range(1, n // 2 + 1)] for i, move in enumerate(moves)}
+    return RuleSet(name, beats, emoji)
+
+
+CLASSIC = RuleSet("Rock Paper Scissors", {
+    "Rock": ["Scissors"],
+    "Paper": ["Rock"],
+    "Scissors": ["Paper"],
+}, {"Rock": "✊", "Paper": "📄", "Scissors": "✂️"})
+
+RPSLS = RuleSet("Rock Paper Scissors Lizard Spock", {
+    "Rock": ["Scissors", "Lizard"],
+    "Paper": ["Rock", "Spock"],
+    "Scissors": ["Paper", "Lizard"],
+    "Lizard": ["Paper", "Spock"],
+    "Spock": ["Rock", "Scissors"],
+}, {"Rock": "✊", "Paper": "📄", "Scissors": "✂️", "Lizard": "🦎", "Spock": "🖖"})
+
+RPS7 = cyclic("RPS-7", ("Rock", "Fire", "Scissors", "Sponge", "Paper", "Air", "Water"), {
+    "Rock": "✊", "Fire": "🔥", "Scissors": "✂️", "Sponge": "🧽", "Paper": "📄", "Air": "💨", "Water": "💧",
+})
+
+RULESETS = {rules.name: rules for rules in (CLASSIC, RPSLS, RPS7)}
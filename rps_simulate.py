@@ -0,0 +1,158 @@
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from rps_predictor import MOVES
+from rps_rules import CLASSIC
+
+# ------------------ Payoff Table ------------------
+# PAYOFF[a, b] is +1 when move a beats move b, -1 when it loses, 0 on a draw
+# (indices follow MOVES: Rock, Paper, Scissors). Indexing it with two whole
+# arrays of moves scores every round at once.
+PAYOFF = np.array([0, 1, -1], dtype=np.int8)[
+    np.frombuffer(CLASSIC.matrix, dtype=np.uint8).reshape(CLASSIC.n, CLASSIC.n)
+]
+
+# COUNTERS[m] is the move that beats move m.
+COUNTERS = np.array(CLASSIC.counters, dtype=np.int64)
+
+
+def counter(moves):
+    return COUNTERS[moves]
+
+
+# ------------------ Strategies ------------------
+# Each strategy plays ``matches`` independent games side by side: move()
+# returns one move per match and observe() sees both sides' moves.
+class Random:
+    def __init__(self, matches, rng):
+        self.matches, self.rng = matches, rng
+
+    def move(self):
+        return self.rng.integers(0, 3, self.matches)
+
+    def observe(self, own, opp):
+        pass
+
+
+class Frequency:
+    """Counter the opponent's most frequent move so far."""
+
+    def __init__(self, matches, rng):
+        self.rng = rng
+        self.counts = np.zeros((matches, 3))
+        self.rows = np.arange(matches)
+
+    def move(self):
+        # Random jitter below 1 only breaks ties between equal counts.
+        return counter((self.counts + self.rng.random(self.counts.shape) * 0.5).argmax(axis=1))
+
+    def observe(self, own, opp):
+        self.counts[self.rows, opp] += 1
+
+
+class Markov:
+    """Counter the opponent's most likely move given their previous one."""
+
+    def __init__(self, matches, rng):
+        self.rng = rng
+        self.counts = np.zeros((matches, 3, 3))
+        self.rows = np.arange(matches)
+        self.prev = None
+
+    def move(self):
+        if self.prev is None:
+            return self.rng.integers(0, 3, len(self.rows))
+        table = self.counts[self.rows, self.prev]
+        return counter((table + self.rng.random(table.shape) * 0.5).argmax(axis=1))
+
+    def observe(self, own, opp):
+        if self.prev is not None:
+            self.counts[self.rows, self.prev, opp] += 1
+        self.prev = opp
+
+
+class WinStayLoseShift:
+    """Repeat a winning move; otherwise play what beats the opponent's last move."""
+
+    def __init__(self, matches, rng):
+        self.rng = rng
+        self.next = rng.integers(0, 3, matches)
+
+    def move(self):
+        return self.next
+
+    def observe(self, own, opp):
+        won = PAYOFF[own, opp] > 0
+        self.next = np.where(won, own, counter(opp))
+
+
+STRATEGIES = {
+    "random": Random,
+    "frequency": Frequency,
+    "markov": Markov,
+    "wsls": WinStayLoseShift,
+}
+
+
+# ------------------ Simulation ------------------
+def simulate(a, b, matches=10_000, rounds=100, seed=None):
+    """Play ``matches`` games of ``rounds`` rounds between strategies ``a`` and ``b``.
+
+    Returns ``(wins, draws, losses)`` totals from ``a``'s side.
+    """
+    rng = np.random.default_rng(seed)
+    player_a = STRATEGIES[a](matches, rng)
+    player_b = STRATEGIES[b](matches, rng)
+    moves_a = np.empty((rounds, matches), dtype=np.int8)
+    moves_b = np.empty((rounds, matches), dtype=np.int8)
+    for r in range(rounds):
+        ma, mb = player_a.move(), player_b.move()
+        player_a.observe(ma, mb)
+        player_b.observe(mb, ma)
+        moves_a[r], moves_b[r] = ma, mb
+    outcome = PAYOFF[moves_a, moves_b]
+    return int((outcome > 0).sum()), int((outcome == 0).sum()), int((outcome < 0).sum())
+
+
+def _rules_loop(a, b):
+    # Per-round scoring the way game.py's decide_winner does it.
+    decide = CLASSIC.decide
+    wins = 0
+    for p1, p2 in zip(a, b):
+        if decide(p1, p2) == "p1":
+            wins += 1
+    return wins
+
+
+def benchmark(rounds=1_000_000):
+    rng = np.random.default_rng()
+    a, b = rng.integers(0, 3, rounds), rng.integers(0, 3, rounds)
+    names_a, names_b = [MOVES[i] for i in a], [MOVES[i] for i in b]
+    start = time.perf_counter()
+    _rules_loop(names_a, names_b)
+    t_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    int((PAYOFF[a, b] > 0).sum())
+    t_table = time.perf_counter() - start
+    print(f"scoring {rounds:,} rounds: per-round dict {rounds / t_loop:,.0f} rounds/s, "
+          f"payoff table {rounds / t_table:,.0f} rounds/s")
+
+
+def main(argv):
+    matches = int(argv[0]) if argv else 10_000
+    rounds = int(argv[1]) if len(argv) > 1 else 100
+    benchmark()
+    for a, b in itertools.combinations(STRATEGIES, 2):
+        start = time.perf_counter()
+        wins, draws, losses = simulate(a, b, matches, rounds)
+        elapsed = time.perf_counter() - start
+        total = wins + draws + losses
+        print(f"{a:>9} vs {b:<9}  win {wins / total:.3f}  draw {draws / total:.3f}  "
+              f"loss {losses / total:.3f}  ({total / elapsed:,.0f} rounds/s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,121 @@
+import os
+import sqlite3
+import threading
+import time
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rps_stats.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id        INTEGER PRIMARY KEY,
+    played_at REAL    NOT NULL,
+    p1        TEXT    NOT NULL,
+    p2        TEXT    NOT NULL,
+    p1_move   TEXT    NOT NULL,
+    p2_move   TEXT    NOT NULL,
+    winner    TEXT    NOT NULL          -- "p1", "p2" or "draw"
+);
+CREATE TABLE IF NOT EXISTS player_stats (
+    player      TEXT PRIMARY KEY,
+    rounds      INTEGER NOT NULL DEFAULT 0,
+    wins        INTEGER NOT NULL DEFAULT 0,
+    losses      INTEGER NOT NULL DEFAULT 0,
+    draws       INTEGER NOT NULL DEFAULT 0,
+    streak      INTEGER NOT NULL DEFAULT 0,  -- current run of wins
+    best_streak INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS player_moves (
+    player TEXT    NOT NULL,
+    move   TEXT    NOT NULL,                -- any rule set's move names
+    count  INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (player, move)
+);
+"""
+
+# One UPDATE per player per round keeps the aggregates current, so reading
+# the scoreboard never has to scan the rounds table.
+UPDATE_PLAYER = """
+UPDATE player_stats SET
+    rounds      = rounds + 1,
+    wins        = wins + :win,
+    losses      = losses + :loss,
+    draws       = draws + :draw,
+    streak      = CASE WHEN :win THEN streak + 1 ELSE 0 END,
+    best_streak = MAX(best_streak, CASE WHEN :win THEN streak + 1 ELSE 0 END)
+WHERE player = :player
+"""
+
+COUNT_MOVE = """
+INSERT INTO player_moves (player, move, count) VALUES (?, ?, 1)
+ON CONFLICT (player, move) DO UPDATE SET count = count + 1
+"""
+
+# Databases from before player_moves existed: count the moves already in rounds.
+BACKFILL_MOVES = """
+INSERT INTO player_moves (player, move, count)
+SELECT player, move, COUNT(*) FROM (
+    SELECT p1 AS player, p1_move AS move FROM rounds
+    UNION ALL
+    SELECT p2, p2_move FROM rounds
+) GROUP BY player, move
+"""
+
+COLUMNS = ("player", "rounds", "wins", "losses", "draws", "streak", "best_streak")
+
+
+# ------------------ Stats Store ------------------
+class StatsStore:
+    """Every round on disk plus per-player aggregates maintained on insert.
+
+    Move counts live in ``player_moves`` keyed by ``(player, move)``, so
+    moves from any rule set are counted, not just Rock/Paper/Scissors.
+    """
+
+    def __init__(self, path=DB_PATH):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            if not self.conn.execute("SELECT 1 FROM player_moves LIMIT 1").fetchone():
+                self.conn.execute(BACKFILL_MOVES)
+        self.lock = threading.Lock()
+
+    def record_round(self, p1, p2, p1_move, p2_move, winner):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO rounds (played_at, p1, p2, p1_move, p2_move, winner) VALUES (?, ?, ?, ?, ?, ?)",
+                (time.time(), p1, p2, p1_move, p2_move, winner),
+            )
+            for player, move, side in ((p1, p1_move, "p1"), (p2, p2_move, "p2")):
+                self.conn.execute("INSERT OR IGNORE INTO player_stats (player) VALUES (?)", (player,))
+                self.conn.execute(UPDATE_PLAYER, {
+                    "player": player,
+                    "win": winner == side,
+                    "loss": winner not in (side, "draw"),
+                    "draw": winner == "draw",
+                })
+                self.conn.execute(COUNT_MOVE, (player, move))
+
+    def player(self, name):
+        """The player's aggregates, with ``moves`` mapping each move played to its count."""
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM player_stats WHERE player = ?", (name,)
+            ).fetchone()
+            if not row:
+                return None
+            moves = dict(self.conn.execute(
+                "SELECT move, count FROM player_moves WHERE player = ?", (name,)
+            ).fetchall())
+        return {**dict(zip(COLUMNS, row)), "moves": moves}
+
+    def leaderboard(self, limit=10):
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM player_stats "
+                "ORDER BY CAST(wins AS REAL) / rounds DESC, rounds DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,20 @@
+import csv
+
+from pw_generate import csv_escape, export
+
+
+def test_csv_escape_is_reversible():
+    passwords = ["=abc", "'=abc", "''x", "+1", "-1", "@a", "\tx", "abc", "a=b"]
+    escaped = [csv_escape(p) for p in passwords]
+    assert escaped[:3] == ["'=abc", "''=abc", "'''x"]
+    assert escaped[-2:] == ["abc", "a=b"]
+    assert [e[1:] if e.startswith("'") else e for e in escaped] == passwords
+
+
+def test_csv_export_escapes_a_leading_quote(tmp_path):
+    path = tmp_path / "passwords.csv"
+    export(str(path), 200, 2, "'=", fmt="csv")
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))[1:]
+    assert len(rows) == 200
+    assert all(len(password) == 3 and password[0] == "'" for _, password in rows)
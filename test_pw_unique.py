@@ -0,0 +1,16 @@
+from pw_unique import IssuedStore
+
+
+def test_store_reopens_after_migrating_without_save(tmp_path):
+    # Crossing exact_limit moves the digests into a Bloom filter; the file
+    # on disk must be a valid Bloom store even if save() never runs.
+    path = str(tmp_path / "issued.bin")
+    passwords = [f"pw{i}" for i in range(60)]
+    store = IssuedStore(path, capacity=10_000, error_rate=1e-6, exact_limit=50)
+    assert store.admit(passwords) == passwords
+    assert store.bloom is not None
+
+    reopened = IssuedStore(path, capacity=10_000, error_rate=1e-6, exact_limit=50)
+    assert reopened.bloom is not None
+    assert reopened.count == 60
+    assert reopened.admit(passwords[:5] + ["new"]) == ["new"]
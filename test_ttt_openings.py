@@ -0,0 +1,37 @@
+from ttt_openings import OpeningIndex
+
+
+def test_symmetric_replies_are_added_together():
+    # X opens in three different corners of the empty board; all three are
+    # the same reply and must share one set of counts.
+    index = OpeningIndex()
+    index.add_game([0, 4, 1, 3, 2], "X")
+    index.add_game([8, 0, 7, 1, 5, 2], "O")
+    index.add_game([2, 4, 0, 1, 7, 3, 5, 8, 6], "Draw")
+    stats = index.lookup([""] * 9)
+    assert set(stats) == {0, 2, 6, 8}
+    for cell in (0, 2, 6, 8):
+        played, win, draw, loss = stats[cell]
+        assert played == 3
+        assert (win, draw, loss) == (1 / 3, 1 / 3, 1 / 3)
+
+
+def test_lookup_in_a_rotated_position():
+    # After X takes the centre, O's corner replies are all equivalent.
+    index = OpeningIndex()
+    index.add_game([4, 0, 8, 2, 1, 7, 6, 3, 5], "Draw")
+    index.add_game([4, 8, 0, 6, 7, 1, 2, 5, 3], "Draw")
+    stats = index.lookup(["", "", "", "", "X", "", "", "", ""])
+    assert {cell: s[0] for cell, s in stats.items()} == {0: 2, 2: 2, 6: 2, 8: 2}
+
+
+def test_a_truncated_index_loads_empty(tmp_path):
+    index = OpeningIndex()
+    index.add_game([4, 0, 8, 2, 1, 7, 6, 3, 5], "Draw")
+    path = str(tmp_path / "openings.idx")
+    index.save(path)
+    assert OpeningIndex.load(path).positions == index.positions
+    with open(path, "r+b") as f:
+        f.truncate(10)
+    loaded = OpeningIndex.load(path)
+    assert loaded.positions == {} and loaded.offset == 0
@@ -0,0 +1,129 @@
+import timeit
+from typing import NamedTuple
+
+# ---------------------
+# Precomputed Masks
+# ---------------------
+COMBOS = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# Bit i is set when cell i (row-major, same indices as st.session_state.board)
+# holds a mark.
+WIN_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in COMBOS)
+FULL = (1 << 9) - 1
+BIT_COUNT = tuple(bin(i).count("1") for i in range(1 << 9))
+
+
+def _first_line(bits):
+    for n, mask in enumerate(WIN_MASKS):
+        if bits & mask == mask:
+            return n
+    return -1
+
+
+# LINE_AT[bits] is the index into COMBOS of the first line completed by a
+# player owning ``bits``, or -1. 512 entries, so a win check is one lookup.
+LINE_AT = tuple(_first_line(bits) for bits in range(1 << 9))
+
+
+class Bitboard(NamedTuple):
+    """Tic-Tac-Toe position as two 9-bit ints, one per player."""
+
+    x: int = 0
+    o: int = 0
+
+    @classmethod
+    def from_cells(cls, board):
+        x = o = 0
+        for i, mark in enumerate(board):
+            if mark == "X":
+                x |= 1 << i
+            elif mark == "O":
+                o |= 1 << i
+        return cls(x, o)
+
+    def to_cells(self):
+        return ["X" if self.x >> i & 1 else "O" if self.o >> i & 1 else "" for i in range(9)]
+
+    @property
+    def occupied(self):
+        return self.x | self.o
+
+    @property
+    def turn(self):
+        return "X" if BIT_COUNT[self.x] == BIT_COUNT[self.o] else "O"
+
+    def legal_moves(self):
+        empty = FULL & ~(self.x | self.o)
+        return [i for i in range(9) if empty >> i & 1]
+
+    def play(self, i, player=None):
+        if (player or self.turn) == "X":
+            return Bitboard(self.x | 1 << i, self.o)
+        return Bitboard(self.x, self.o | 1 << i)
+
+
+# ---------------------
+# Win / Draw Detection
+# ---------------------
+def has_line(bits):
+    return LINE_AT[bits] >= 0
+
+
+def result(bb):
+    """Return ``(winner, combo)`` for a position without touching any state.
+
+    ``winner`` is "X", "O", "Draw" or None; ``combo`` is the winning line as a
+    tuple of cell indices, or an empty tuple.
+    """
+    x, o = bb
+    n = LINE_AT[x]
+    if n >= 0:
+        return "X", COMBOS[n]
+    n = LINE_AT[o]
+    if n >= 0:
+        return "O", COMBOS[n]
+    if x | o == FULL:
+        return "Draw", ()
+    return None, ()
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def _list_check_winner(board):
+    # The original list-of-strings check from app.py, minus the session write.
+    combos = [
+        [0,1,2], [3,4,5], [6,7,8],
+        [0,3,6], [1,4,7], [2,5,8],
+        [0,4,8], [2,4,6]
+    ]
+    for c in combos:
+        if board[c[0]] == board[c[1]] == board[c[2]] != "":
+            return board[c[0]]
+    if "" not in board:
+        return "Draw"
+    return None
+
+
+def benchmark(number=200_000):
+    positions = [
+        ["X", "O", "X", "", "O", "", "", "", ""],
+        ["X", "O", "X", "O", "X", "O", "O", "X", "O"],
+        ["X", "X", "X", "O", "O", "", "", "", ""],
+    ]
+    for cells in positions:
+        bb = Bitboard.from_cells(cells)
+        t_list = timeit.timeit(lambda: _list_check_winner(cells), number=number)
+        t_bits = timeit.timeit(lambda: result(bb), number=number)
+        t_conv = timeit.timeit(lambda: result(Bitboard.from_cells(cells)), number=number)
+        print(f"{''.join(c or '.' for c in cells)}  list {t_list / number * 1e9:6.0f} ns"
+              f"  bitboard {t_bits / number * 1e9:6.0f} ns (x{t_list / t_bits:.1f})"
+              f"  from_cells+bitboard {t_conv / number * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,58 @@
+# ---------------------
+# N x N, k-in-a-row Boards
+# ---------------------
+# Boards are flat row-major lists of "", "X" and "O" (the same shape as
+# st.session_state.board), so a 3x3 game is just n=3, k=3.
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+PRESETS = {
+    "3×3 (classic)": (3, 3),
+    "4×4, 4 in a row": (4, 4),
+    "5×5, 4 in a row": (5, 4),
+    "7×7, 5 in a row": (7, 5),
+    "15×15 Gomoku": (15, 5),
+}
+
+
+def new_board(n):
+    return [""] * (n * n)
+
+
+def _run(board, n, row, col, dr, dc, mark, limit):
+    """Cells matching ``mark`` stepping (dr, dc) from (row, col), at most ``limit``."""
+    cells = []
+    r, c = row + dr, col + dc
+    while len(cells) < limit and 0 <= r < n and 0 <= c < n and board[r * n + c] == mark:
+        cells.append(r * n + c)
+        r, c = r + dr, c + dc
+    return cells
+
+
+def line_through(board, n, k, move):
+    """Return the k-in-a-row through ``move`` as a tuple of cells, or ().
+
+    Only the four lines through the last placed stone are scanned, and each
+    scan stops after k-1 stones either way, so the check is O(k) regardless
+    of board size. The returned cells run from one end of the line to the
+    other.
+    """
+    mark = board[move]
+    if mark == "":
+        return ()
+    row, col = divmod(move, n)
+    for dr, dc in DIRECTIONS:
+        back = _run(board, n, row, col, -dr, -dc, mark, k - 1)
+        ahead = _run(board, n, row, col, dr, dc, mark, k - 1 - len(back))
+        if len(back) + 1 + len(ahead) >= k:
+            return tuple(back[::-1]) + (move,) + tuple(ahead)
+    return ()
+
+
+def result_after(board, n, k, move, turns):
+    """``(winner, combo)`` after ``move`` was the ``turns``-th stone placed."""
+    combo = line_through(board, n, k, move)
+    if combo:
+        return board[move], combo
+    if turns == n * n:
+        return "Draw", ()
+    return None, ()
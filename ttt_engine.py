@@ -0,0 +1,145 @@
+import time
+
+from ttt_bitboard import BIT_COUNT, FULL, Bitboard, has_line
+from ttt_game import other
+from ttt_symmetry import canonical
+
+# Move ordering: centre, corners, then edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+# ---------------------
+# Negamax Engine
+# ---------------------
+class Engine:
+    """Negamax search with alpha-beta pruning and a transposition table.
+
+    Scores are from the point of view of the player to move: a win is worth
+    more the sooner it happens, a draw is 0. The table is keyed by the
+    canonical form of the ``(mine, theirs)`` bitboard pair, so the 8
+    rotations/reflections of a position share one entry, and it survives
+    between calls so later moves are mostly answered from the table.
+    """
+
+    def __init__(self):
+        self.table = {}
+        self.nodes = 0
+
+    def _negamax(self, mine, theirs, alpha, beta):
+        self.nodes += 1
+        key = canonical(mine, theirs)[0]
+        entry = self.table.get(key)
+        if entry is not None:
+            score, flag = entry
+            if flag == EXACT:
+                return score
+            if flag == LOWER and score >= beta:
+                return score
+            if flag == UPPER and score <= alpha:
+                return score
+
+        occupied = mine | theirs
+        empty = 9 - BIT_COUNT[occupied]
+        if has_line(theirs):
+            # The previous player just completed a line.
+            return -(empty + 1)
+        if occupied == FULL:
+            return 0
+
+        alpha_orig = alpha
+        best = -100
+        for i in MOVE_ORDER:
+            bit = 1 << i
+            if occupied & bit:
+                continue
+            score = -self._negamax(theirs, mine | bit, -beta, -alpha)
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        if best <= alpha_orig:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table[key] = (best, flag)
+        return best
+
+    @staticmethod
+    def _split(board, player):
+        bb = board if isinstance(board, Bitboard) else Bitboard.from_cells(board)
+        return (bb.x, bb.o) if player == "X" else (bb.o, bb.x)
+
+    def evaluate(self, board, player):
+        """Exact game value of ``board`` for ``player`` to move."""
+        mine, theirs = self._split(board, player)
+        return self._negamax(mine, theirs, -100, 100)
+
+    def warm(self):
+        """Solve every reachable position so later searches are table hits."""
+        seen = set()
+
+        def walk(mine, theirs):
+            key = canonical(mine, theirs)[0]
+            if key in seen or has_line(theirs) or mine | theirs == FULL:
+                return
+            seen.add(key)
+            for i in range(9):
+                bit = 1 << i
+                if not (mine | theirs) & bit:
+                    self._negamax(theirs, mine | bit, -100, 100)
+                    walk(theirs, mine | bit)
+
+        walk(0, 0)
+
+    def best_move(self, board, player):
+        """Return the index of the best move for ``player``, or None if the game is over."""
+        mine, theirs = self._split(board, player)
+        occupied = mine | theirs
+        if has_line(mine) or has_line(theirs) or occupied == FULL:
+            return None
+        best_move, best_score = None, -100
+        for i in MOVE_ORDER:
+            bit = 1 << i
+            if occupied & bit:
+                continue
+            score = -self._negamax(theirs, mine | bit, -100, 100)
+            if score > best_score:
+                best_move, best_score = i, score
+        return best_move
+
+
+# ---------------------
+# Benchmark
+# ---------------------
+def benchmark():
+    engine = Engine()
+    for label in ("cold", "warm"):
+        if label == "warm":
+            start = time.perf_counter()
+            engine.warm()
+            print(f"warm-up: {(time.perf_counter() - start) * 1000:.1f} ms")
+        board = [""] * 9
+        player = "X"
+        print(f"{label} table:")
+        while True:
+            engine.nodes = 0
+            start = time.perf_counter()
+            move = engine.best_move(board, player)
+            elapsed = time.perf_counter() - start
+            if move is None:
+                break
+            print(f"  {player} -> {move}  nodes={engine.nodes:6d}  {elapsed * 1000:8.3f} ms")
+            board[move] = player
+            player = other(player)
+        print(f"  table entries: {len(engine.table)}")
+
+
+if __name__ == "__main__":
+    benchmark()
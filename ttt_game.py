@@ -0,0 +1,125 @@
+import random
+import sys
+import time
+
+from ttt_bitboard import COMBOS, LINE_AT
+from ttt_board import line_through, new_board
+
+
+def other(player):
+    return "O" if player == "X" else "X"
+
+
+# ---------------------
+# Game State
+# ---------------------
+class Game:
+    """A Tic-Tac-Toe game on an n×n board with k in a row to win.
+
+    Pure Python with no Streamlit dependency, so the same object backs the
+    app, tests, simulations and the CLI below. ``board`` is the flat list of
+    "", "X", "O" cells; ``history`` the cells played so far.
+    """
+
+    def __init__(self, n=3, k=3):
+        self.n = n
+        self.k = k
+        self.board = new_board(n)
+        self.history = []
+        self.player = "X"
+        self.win_combo = ()
+        self._winner = None
+        # 3×3 keeps bitboards alongside the cells for one-lookup win checks.
+        self._bits = {"X": 0, "O": 0} if n == 3 and k == 3 else None
+
+    def legal_moves(self):
+        if self._winner is not None:
+            return []
+        return [i for i, mark in enumerate(self.board) if mark == ""]
+
+    def winner(self):
+        """"X", "O", "Draw" or None while the game is still going."""
+        return self._winner
+
+    def is_over(self):
+        return self._winner is not None
+
+    def play(self, move):
+        if self._winner is not None:
+            raise ValueError("game is already over")
+        if not 0 <= move < len(self.board) or self.board[move] != "":
+            raise ValueError(f"illegal move {move}")
+        player = self.player
+        self.board[move] = player
+        self.history.append(move)
+
+        if self._bits is not None:
+            self._bits[player] |= 1 << move
+            line = LINE_AT[self._bits[player]]
+            combo = COMBOS[line] if line >= 0 else ()
+        else:
+            combo = line_through(self.board, self.n, self.k, move)
+
+        if combo:
+            self._winner, self.win_combo = player, combo
+        elif len(self.history) == len(self.board):
+            self._winner = "Draw"
+        self.player = other(player)
+        return self._winner
+
+    def undo(self):
+        """Take back the last move; returns it, or None on an empty board."""
+        if not self.history:
+            return None
+        move = self.history.pop()
+        player = self.board[move]
+        self.board[move] = ""
+        if self._bits is not None:
+            self._bits[player] &= ~(1 << move)
+        self.player = player
+        self._winner, self.win_combo = None, ()
+        return move
+
+    @property
+    def turns(self):
+        return len(self.history)
+
+    def copy(self):
+        game = Game.__new__(Game)
+        game.__dict__.update(self.__dict__)
+        game.board = list(self.board)
+        game.history = list(self.history)
+        if self._bits is not None:
+            game._bits = dict(self._bits)
+        return game
+
+
+# ---------------------
+# CLI Runner
+# ---------------------
+def play_random(n=3, k=3, rng=random):
+    game = Game(n, k)
+    moves = list(range(n * n))
+    rng.shuffle(moves)
+    for move in moves:
+        if game.play(move):
+            break
+    return game
+
+
+def main(argv):
+    games = int(argv[0]) if argv else 10_000
+    n = int(argv[1]) if len(argv) > 1 else 3
+    k = int(argv[2]) if len(argv) > 2 else n if n <= 4 else 5
+    counts = {"X": 0, "O": 0, "Draw": 0}
+    start = time.perf_counter()
+    for _ in range(games):
+        counts[play_random(n, k).winner()] += 1
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} random games on {n}x{n} (k={k}) in {elapsed:.2f} s "
+          f"= {games / elapsed:,.0f} games/s")
+    print(counts)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
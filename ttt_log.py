@@ -0,0 +1,132 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from ttt_game import Game
+from ttt_symmetry import PERMS
+
+# ---------------------
+# Record Format
+# ---------------------
+# Every finished 3×3 game is one fixed 5-byte record:
+#   byte 0     outcome << 4 | number of moves (outcome 0 draw, 1 X, 2 O)
+#   bytes 1-4  the first 8 moves as nibbles, high nibble first, 0xF = unused
+# A 9-move game's last move is the one empty cell left, so it is not stored.
+# Fixed-size records let the bulk reader view a whole log as one array.
+RECORD_SIZE = 5
+OUTCOMES = ("Draw", "X", "O")
+LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ttt_games.log")
+
+
+def encode(moves, winner):
+    if not 1 <= len(moves) <= 9:
+        raise ValueError("a logged game has 1 to 9 moves")
+    nibbles = list(moves[:8]) + [0xF] * (8 - min(len(moves), 8))
+    packed = bytes(nibbles[i] << 4 | nibbles[i + 1] for i in range(0, 8, 2))
+    return bytes([OUTCOMES.index(winner) << 4 | len(moves)]) + packed
+
+
+def decode(record):
+    """Return ``(moves, winner)`` for one 5-byte record."""
+    length = record[0] & 0xF
+    moves = []
+    for byte in record[1:RECORD_SIZE]:
+        moves.append(byte >> 4)
+        moves.append(byte & 0xF)
+    moves = moves[:min(length, 8)]
+    if length == 9:
+        moves.append(36 - sum(moves))   # cells 0..8 sum to 36
+    return moves, OUTCOMES[record[0] >> 4]
+
+
+# ---------------------
+# Log File
+# ---------------------
+class GameLog:
+    """Append-only binary log of finished games."""
+
+    def __init__(self, path=LOG_PATH):
+        self.path = path
+
+    def append(self, moves, winner):
+        with open(self.path, "ab") as f:
+            f.write(encode(moves, winner))
+
+    def __len__(self):
+        return os.path.getsize(self.path) // RECORD_SIZE if os.path.exists(self.path) else 0
+
+    def read(self, index):
+        with open(self.path, "rb") as f:
+            f.seek(index * RECORD_SIZE)
+            return decode(f.read(RECORD_SIZE))
+
+    def tail(self, count):
+        """The last ``count`` games, newest first, as ``(index, moves, winner)``."""
+        total = len(self)
+        start = max(0, total - count)
+        with open(self.path, "rb") as f:
+            f.seek(start * RECORD_SIZE)
+            data = f.read()
+        games = [(start + i, *decode(data[i * RECORD_SIZE:(i + 1) * RECORD_SIZE]))
+                 for i in range(len(data) // RECORD_SIZE)]
+        return games[::-1]
+
+    def records(self):
+        """The whole log as an (games, 5) uint8 array, without decoding."""
+        if not os.path.exists(self.path):
+            return np.zeros((0, RECORD_SIZE), dtype=np.uint8)
+        data = np.fromfile(self.path, dtype=np.uint8)
+        return data[:len(data) - len(data) % RECORD_SIZE].reshape(-1, RECORD_SIZE)
+
+
+def replay(moves):
+    """Yield the Game after each move, starting from the empty board."""
+    game = Game()
+    yield game.copy()
+    for move in moves:
+        game.play(move)
+        yield game.copy()
+
+
+# ---------------------
+# Bulk Statistics
+# ---------------------
+def stats(records):
+    """Outcome counts, average length and first-move counts over a record array."""
+    outcome = records[:, 0] >> 4
+    length = records[:, 0] & 0xF
+    counts = np.bincount(outcome, minlength=3)
+    return {
+        "games": len(records),
+        "outcomes": dict(zip(OUTCOMES, counts.tolist())),
+        "average_length": float(length.mean()) if len(records) else 0.0,
+        "openings": np.bincount(records[:, 1] >> 4, minlength=9)[:9].tolist(),
+    }
+
+
+def canonical_moves(moves):
+    """The move sequence under whichever of the 8 symmetries sorts first."""
+    return min(tuple(p[m] for m in moves) for p in PERMS)
+
+
+def count_distinct(records):
+    """Number of distinct games once rotations/reflections are merged."""
+    return len({canonical_moves(decode(bytes(r))[0]) for r in records})
+
+
+def main(argv):
+    path = argv[0] if argv else LOG_PATH
+    start = time.perf_counter()
+    records = GameLog(path).records()
+    result = stats(records)
+    elapsed = time.perf_counter() - start
+    print(f"{result['games']:,} games scanned in {elapsed * 1000:.1f} ms "
+          f"= {result['games'] / max(elapsed, 1e-9):,.0f} games/s")
+    print(result)
+    print(f"{count_distinct(records):,} distinct games up to symmetry")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
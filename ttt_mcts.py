@@ -0,0 +1,209 @@
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ttt_board import line_through, new_board
+from ttt_game import other
+
+EXPLORATION = 1.4
+
+
+def candidate_moves(board, n):
+    """Empty cells the tree expands into.
+
+    Up to 5×5 that is every empty cell; on bigger boards only cells within
+    two steps of a stone (or the centre on an empty board) are considered.
+    """
+    empty = [i for i, mark in enumerate(board) if mark == ""]
+    if n <= 5:
+        return empty
+    if len(empty) == len(board):
+        return [(n // 2) * n + n // 2]
+    near = []
+    for i in empty:
+        r, c = divmod(i, n)
+        for dr in (-2, -1, 0, 1, 2):
+            rr = r + dr
+            if not 0 <= rr < n:
+                continue
+            row = board[rr * n + max(0, c - 2):rr * n + min(n, c + 3)]
+            if "X" in row or "O" in row:
+                near.append(i)
+                break
+    return near
+
+
+# ---------------------
+# Tree
+# ---------------------
+class Node:
+    __slots__ = ("move", "parent", "children", "untried", "wins", "visits", "mover")
+
+    def __init__(self, move, parent, untried, mover):
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = untried
+        self.wins = 0.0
+        self.visits = 0
+        self.mover = mover          # player who made ``move``
+
+    def select(self):
+        log_n = math.log(self.visits)
+        return max(self.children,
+                   key=lambda c: c.wins / c.visits + EXPLORATION * math.sqrt(log_n / c.visits))
+
+
+def _playout(board, n, k, player, rng):
+    """Random moves from ``board`` to the end; returns the winner or "Draw"."""
+    empty = [i for i, mark in enumerate(board) if mark == ""]
+    while empty:
+        j = rng.randrange(len(empty))
+        move = empty[j]
+        empty[j] = empty[-1]
+        empty.pop()
+        board[move] = player
+        if line_through(board, n, k, move):
+            return player
+        player = other(player)
+    return "Draw"
+
+
+def search(board, n, k, player, turns, budget, seed=None):
+    """Run UCT from ``board`` for ``budget`` seconds.
+
+    Returns ``(visits, playouts)`` where ``visits`` maps each root move to its
+    visit count. This is the unit of work each pool worker runs.
+    """
+    rng = random.Random(seed)
+    root = Node(None, None, candidate_moves(board, n), other(player))
+    rng.shuffle(root.untried)
+    deadline = time.perf_counter() + budget
+    playouts = 0
+    while time.perf_counter() < deadline or playouts == 0:
+        node = root
+        scratch = list(board)
+        t = turns
+        winner = None
+
+        # Selection
+        while not node.untried and node.children:
+            node = node.select()
+            scratch[node.move] = node.mover
+            t += 1
+
+        # Expansion
+        if node.untried:
+            move = node.untried.pop()
+            mover = other(node.mover)
+            scratch[move] = mover
+            t += 1
+            if line_through(scratch, n, k, move):
+                winner = mover
+                untried = []
+            elif t == n * n:
+                winner = "Draw"
+                untried = []
+            else:
+                untried = candidate_moves(scratch, n)
+                rng.shuffle(untried)
+            child = Node(move, node, untried, mover)
+            node.children.append(child)
+            node = child
+        elif node is not root and line_through(scratch, n, k, node.move):
+            # Terminal node reached again.
+            winner = node.mover
+
+        # Simulation
+        if winner is None:
+            winner = _playout(scratch, n, k, other(node.mover), rng)
+        playouts += 1
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner == node.mover:
+                node.wins += 1
+            elif winner == "Draw":
+                node.wins += 0.5
+            node = node.parent
+        if not root.children and not root.untried:
+            break
+    return {c.move: c.visits for c in root.children}, playouts
+
+
+# ---------------------
+# Root-parallel Player
+# ---------------------
+class MCTSPlayer:
+    """Root-parallel MCTS: every worker grows its own tree from the same
+    position for the time budget, then the root visit counts are summed and
+    the most visited move is played.
+
+    One player can be shared between threads (the Streamlit app keeps a
+    single cached instance): the pool is created under a lock and
+    ``choose`` keeps no per-call state on the object. Workers start from a
+    forkserver, since forking a multi-threaded server process can deadlock.
+    """
+
+    def __init__(self, budget=1.0, workers=None):
+        self.budget = budget
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self):
+        with self._lock:
+            if self._pool is None and self.workers > 1:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("forkserver"))
+            return self._pool
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def choose(self, board, n, k, player, turns, budget=None):
+        """Return ``(move, playouts, playouts_per_second)``."""
+        budget = budget or self.budget
+        start = time.perf_counter()
+        if self.workers == 1:
+            results = [search(board, n, k, player, turns, budget)]
+        else:
+            seeds = [random.getrandbits(32) for _ in range(self.workers)]
+            futures = [self.pool.submit(search, board, n, k, player, turns, budget, s)
+                       for s in seeds]
+            results = [f.result() for f in futures]
+        visits = {}
+        for counts, _ in results:
+            for move, v in counts.items():
+                visits[move] = visits.get(move, 0) + v
+        playouts = sum(p for _, p in results)
+        return max(visits, key=visits.get), playouts, playouts / (time.perf_counter() - start)
+
+
+def benchmark(n=15, k=5, budget=1.0):
+    board = new_board(n)
+    center = (n // 2) * n + n // 2
+    board[center] = "X"
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        player = MCTSPlayer(budget, workers)
+        move, playouts, rate = player.choose(board, n, k, "O", 1)
+        player.close()
+        print(f"{n}x{n} k={k} workers={workers:2d}  move={move:3d}  "
+              f"playouts={playouts:7d}  {rate:9.0f} playouts/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    benchmark(*args)
@@ -0,0 +1,120 @@
+import os
+import pickle
+import sys
+import threading
+
+from ttt_bitboard import Bitboard
+from ttt_log import LOG_PATH, RECORD_SIZE, GameLog, decode
+from ttt_symmetry import MAPPED, PERMS, canonical, map_move, unmap_move
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ttt_openings.idx")
+INDEX_VERSION = 2       # bump when the stored layout changes; older indexes are rebuilt
+WIN, DRAW, LOSS = 0, 1, 2
+
+
+def _orbit_min(key, move):
+    # Smallest cell equivalent to ``move`` under the symmetries that leave
+    # the canonical position ``key`` unchanged.
+    x, o = key & 0x1FF, key >> 9
+    return min(PERMS[s][move] for s in range(8) if MAPPED[s][x] | MAPPED[s][o] << 9 == key)
+
+
+# ---------------------
+# Opening Index
+# ---------------------
+class OpeningIndex:
+    """Reply statistics per position, keyed by canonical position.
+
+    ``positions[key][move]`` is ``[wins, draws, losses]`` for the player who
+    played ``move`` (in canonical coordinates) from the canonical position
+    ``key``. Equivalent replies from a symmetric position are stored under
+    one cell, the smallest in their orbit. Games are folded in one at a time
+    and ``offset`` remembers how many log records are already counted, so
+    syncing with the log only reads what was appended since the last sync.
+    """
+
+    def __init__(self):
+        self.positions = {}
+        self.offset = 0
+        self.lock = threading.Lock()
+
+    def add_game(self, moves, winner):
+        x = o = 0
+        for ply, move in enumerate(moves):
+            player = "X" if ply % 2 == 0 else "O"
+            key, sym = canonical(x, o)
+            counts = self.positions.setdefault(key, {}).setdefault(_orbit_min(key, map_move(move, sym)), [0, 0, 0])
+            counts[DRAW if winner == "Draw" else WIN if winner == player else LOSS] += 1
+            if player == "X":
+                x |= 1 << move
+            else:
+                o |= 1 << move
+
+    def sync(self, log):
+        """Fold in records appended to ``log`` since the last sync; returns how many."""
+        with self.lock:
+            total = len(log)
+            if total <= self.offset:
+                return 0
+            with open(log.path, "rb") as f:
+                f.seek(self.offset * RECORD_SIZE)
+                data = f.read((total - self.offset) * RECORD_SIZE)
+            for i in range(0, len(data), RECORD_SIZE):
+                self.add_game(*decode(data[i:i + RECORD_SIZE]))
+            added = total - self.offset
+            self.offset = total
+            return added
+
+    def lookup(self, board):
+        """Replies seen from ``board`` as ``{cell: (played, win, draw, loss rates)}``.
+
+        Cells are in the board's own orientation. When the position is
+        symmetric, equivalent cells share one set of statistics.
+        """
+        bb = board if isinstance(board, Bitboard) else Bitboard.from_cells(board)
+        key, _ = canonical(bb.x, bb.o)
+        with self.lock:
+            replies = {move: tuple(counts) for move, counts in self.positions.get(key, {}).items()}
+        syms = [s for s in range(8) if MAPPED[s][bb.x] | MAPPED[s][bb.o] << 9 == key]
+        stats = {}
+        for move, (w, d, l) in replies.items():
+            total = w + d + l
+            for s in syms:
+                stats[unmap_move(move, s)] = (total, w / total, d / total, l / total)
+        return stats
+
+    # ---------------------
+    # Persistence
+    # ---------------------
+    def save(self, path=INDEX_PATH):
+        tmp = path + ".tmp"
+        with self.lock, open(tmp, "wb") as f:
+            pickle.dump((INDEX_VERSION, self.offset, self.positions), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """The saved index, or an empty one (rebuilt by ``sync``) if it is
+        missing, outdated or unreadable."""
+        index = cls()
+        try:
+            with open(path, "rb") as f:
+                saved = pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return index
+        if isinstance(saved, tuple) and len(saved) == 3 and saved[0] == INDEX_VERSION:
+            _, index.offset, index.positions = saved
+        return index
+
+
+def main(argv):
+    log = GameLog(argv[0] if argv else LOG_PATH)
+    index = OpeningIndex()
+    added = index.sync(log)
+    print(f"indexed {added:,} games into {len(index.positions):,} canonical positions")
+    for cell, (played, w, d, l) in sorted(index.lookup([""] * 9).items()):
+        print(f"  X opens {cell}: played {played:,}  win {w:.3f}  draw {d:.3f}  loss {l:.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,96 @@
+import io
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+# ---------------------
+# Board Rendering
+# ---------------------
+# Everything here is cached at module level, which (unlike app.py's globals)
+# survives Streamlit reruns: the grid and the glyphs are drawn once per size,
+# and finished boards are kept as encoded PNG bytes in a bounded LRU.
+RENDER_CACHE_SIZE = 256
+COLORS = {"X": "red", "O": "blue"}
+
+
+def cell_size_for(n):
+    return max(100, 300 // n) if n <= 3 else max(30, 600 // n)
+
+
+@lru_cache(maxsize=None)
+def _font():
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=16)
+def _background(n):
+    cell_size = cell_size_for(n)
+    size = cell_size * n
+    img = Image.new("RGB", (size, size), "white")
+    draw = ImageDraw.Draw(img)
+    for i in range(1, n):
+        draw.line((0, i*cell_size, size, i*cell_size), fill="black", width=4)
+        draw.line((i*cell_size, 0, i*cell_size, size), fill="black", width=4)
+    return img
+
+
+@lru_cache(maxsize=32)
+def _sprite(mark, cell_size):
+    img = Image.new("RGBA", (cell_size, cell_size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.text((cell_size//2 - 10, cell_size//2 - 10), mark, fill=COLORS[mark], font=_font())
+    return img
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_png(board, win_combo, n):
+    """PNG bytes for ``board`` (a tuple of cells) with an optional win line.
+
+    Arguments must be hashable; identical boards are served from the cache.
+    """
+    cell_size = cell_size_for(n)
+    img = _background(n).copy()
+
+    for i, mark in enumerate(board):
+        if mark:
+            sprite = _sprite(mark, cell_size)
+            img.paste(sprite, ((i % n) * cell_size, (i // n) * cell_size), sprite)
+
+    if win_combo:
+        c = win_combo
+        x1 = (c[0]%n)*cell_size + cell_size//2
+        y1 = (c[0]//n)*cell_size + cell_size//2
+        x2 = (c[-1]%n)*cell_size + cell_size//2
+        y2 = (c[-1]//n)*cell_size + cell_size//2
+        ImageDraw.Draw(img).line((x1, y1, x2, y2), fill="green", width=6)
+
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_svg(board, win_combo, n):
+    """Inline SVG markup for the same board; a few hundred bytes for 3×3.
+
+    Uses a unit grid (one cell = 10 units) and scales to its container.
+    """
+    size = 10 * n
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" '
+             f'width="100%" style="background:white">']
+    grid = "".join(f"M{i*10} 0V{size}M0 {i*10}H{size}" for i in range(1, n))
+    if grid:
+        parts.append(f'<path d="{grid}" stroke="black" stroke-width=".4"/>')
+    parts.append('<g font-size="7" font-family="sans-serif" text-anchor="middle" dominant-baseline="central">')
+    for i, mark in enumerate(board):
+        if mark:
+            parts.append(f'<text x="{(i % n) * 10 + 5}" y="{(i // n) * 10 + 5}" '
+                         f'fill="{COLORS[mark]}">{mark}</text>')
+    parts.append("</g>")
+    if win_combo:
+        c = win_combo
+        parts.append(f'<line x1="{(c[0]%n)*10 + 5}" y1="{(c[0]//n)*10 + 5}" '
+                     f'x2="{(c[-1]%n)*10 + 5}" y2="{(c[-1]//n)*10 + 5}" '
+                     f'stroke="green" stroke-width=".6" stroke-linecap="round"/>')
+    parts.append("</svg>")
+    return "".join(parts)
@@ -0,0 +1,95 @@
+import random
+import string
+import threading
+
+from ttt_game import Game
+
+CODE_LENGTH = 4
+
+
+# ---------------------
+# Rooms
+# ---------------------
+class Room:
+    def __init__(self, n, k):
+        self.game = Game(n, k)
+        self.players = {"X": None, "O": None}
+        self.version = 0
+        self.games = 0          # bumped by every reset, so each game has its own number
+        self.lock = threading.Lock()
+
+
+class RoomStore:
+    """In-process, thread-safe store of shared games keyed by room code.
+
+    Meant to live in ``st.cache_resource`` so every browser session on the
+    server sees the same rooms. Each room has its own lock for moves; the
+    store lock only guards creating rooms. ``version`` goes up on every
+    change, so a client can poll it and re-render only when it moves;
+    ``games`` numbers the games played in a room.
+    """
+
+    def __init__(self):
+        self.rooms = {}
+        self.lock = threading.Lock()
+
+    def create(self, n=3, k=3):
+        with self.lock:
+            while True:
+                code = "".join(random.choices(string.ascii_uppercase, k=CODE_LENGTH))
+                if code not in self.rooms:
+                    self.rooms[code] = Room(n, k)
+                    return code
+
+    def join(self, code, client_id):
+        """Seat ``client_id`` in room ``code``; returns "X", "O" or None for a spectator."""
+        room = self.rooms[code]
+        with room.lock:
+            for mark, seated in room.players.items():
+                if seated == client_id:
+                    return mark
+            for mark, seated in room.players.items():
+                if seated is None:
+                    room.players[mark] = client_id
+                    room.version += 1
+                    return mark
+            return None
+
+    def leave(self, code, client_id):
+        """Free ``client_id``'s seat in room ``code``, so someone else can join."""
+        room = self.rooms[code]
+        with room.lock:
+            for mark, seated in room.players.items():
+                if seated == client_id:
+                    room.players[mark] = None
+                    room.version += 1
+
+    def version(self, code):
+        # A plain int read; no lock needed to see whether anything changed.
+        return self.rooms[code].version
+
+    def snapshot(self, code):
+        """``(version, game copy, players, game number)`` taken under the room lock."""
+        room = self.rooms[code]
+        with room.lock:
+            return room.version, room.game.copy(), dict(room.players), room.games
+
+    def play(self, code, client_id, move):
+        """Apply ``move`` if it is ``client_id``'s turn; returns True if it was played."""
+        room = self.rooms[code]
+        with room.lock:
+            game = room.game
+            if room.players.get(game.player) != client_id or game.is_over():
+                return False
+            if move not in game.legal_moves():
+                return False
+            game.play(move)
+            room.version += 1
+            return True
+
+    def reset(self, code):
+        room = self.rooms[code]
+        with room.lock:
+            room.game = Game(room.game.n, room.game.k)
+            room.games += 1
+            room.version += 1
@@ -0,0 +1,119 @@
+import sys
+import time
+
+import numpy as np
+
+from ttt_bitboard import COMBOS
+from ttt_table import PerfectPlayTable
+
+# ---------------------
+# Batch Representation
+# ---------------------
+# A batch is an (games, 9) int8 array: 0 empty, 1 X, 2 O. COMBO_INDEX lets
+# ``boards[:, COMBO_INDEX]`` gather every line of every board in one go.
+COMBO_INDEX = np.array(COMBOS, dtype=np.intp)
+POWERS = 3 ** np.arange(9)
+CELL_BITS = 1 << np.arange(9)
+POLICIES = ("random", "perfect")
+
+OUTCOMES = ("X", "O", "Draw")
+
+
+def _pick_moves(boards, policy, rng, moves_table):
+    """One move per board: random among legal cells, or among the table's best."""
+    allowed = boards == 0
+    if policy == "perfect":
+        # Same base-3 index as ttt_table: empty=0, X=1, O=2.
+        best = moves_table[boards @ POWERS]
+        allowed &= (best[:, None] & CELL_BITS) != 0
+    scores = rng.random(boards.shape)
+    scores[~allowed] = -1.0
+    return scores.argmax(axis=1)
+
+
+def play_batch(games, policies=("random", "random"), rng=None, moves_table=None):
+    """Play ``games`` games at once; returns (winner, length, opening) arrays.
+
+    ``winner`` is 1 (X), 2 (O) or 0 (draw), ``length`` the number of plies and
+    ``opening`` X's first cell.
+    """
+    rng = rng or np.random.default_rng()
+    boards = np.zeros((games, 9), dtype=np.int8)
+    winner = np.zeros(games, dtype=np.int8)
+    length = np.full(games, 9, dtype=np.int8)
+    opening = np.zeros(games, dtype=np.int8)
+    active = np.arange(games)
+
+    for ply in range(9):
+        player = 1 if ply % 2 == 0 else 2
+        current = boards[active]
+        moves = _pick_moves(current, policies[ply % 2], rng, moves_table)
+        current[np.arange(len(active)), moves] = player
+        boards[active] = current
+        if ply == 0:
+            opening[:] = moves
+
+        won = (current[:, COMBO_INDEX] == player).all(axis=2).any(axis=1)
+        finished = active[won]
+        winner[finished] = player
+        length[finished] = ply + 1
+        active = active[~won]
+        if not len(active):
+            break
+    return winner, length, opening
+
+
+def simulate(games, x_policy="random", o_policy="random", seed=None, chunk=1_000_000):
+    """Play ``games`` games in chunks and return aggregate statistics."""
+    for policy in (x_policy, o_policy):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown policy {policy!r}, expected one of {POLICIES}")
+    rng = np.random.default_rng(seed)
+    moves_table = None
+    if "perfect" in (x_policy, o_policy):
+        moves_table = np.frombuffer(PerfectPlayTable.load().moves, dtype=np.uint16)
+
+    outcomes = np.zeros(3, dtype=np.int64)
+    by_opening = np.zeros((9, 3), dtype=np.int64)
+    plies = 0
+    done = 0
+    while done < games:
+        n = min(chunk, games - done)
+        winner, length, opening = play_batch(n, (x_policy, o_policy), rng, moves_table)
+        # 1 -> X, 2 -> O, 0 -> Draw in OUTCOMES order
+        code = (winner + 2) % 3
+        outcomes += np.bincount(code, minlength=3)
+        by_opening += np.bincount(opening * 3 + code, minlength=27).reshape(9, 3)
+        plies += int(length.sum())
+        done += n
+
+    return {
+        "games": games,
+        "outcomes": dict(zip(OUTCOMES, outcomes.tolist())),
+        "first_player_win_rate": outcomes[0] / games,
+        "average_length": plies / games,
+        "openings": {cell: dict(zip(OUTCOMES, row.tolist())) for cell, row in enumerate(by_opening)},
+    }
+
+
+def main(argv):
+    games = int(argv[0]) if argv else 1_000_000
+    x_policy = argv[1] if len(argv) > 1 else "random"
+    o_policy = argv[2] if len(argv) > 2 else "random"
+    start = time.perf_counter()
+    stats = simulate(games, x_policy, o_policy)
+    elapsed = time.perf_counter() - start
+    print(f"{games:,} games ({x_policy} vs {o_policy}) in {elapsed:.2f} s "
+          f"= {games / elapsed:,.0f} games/s")
+    print(f"outcomes: {stats['outcomes']}")
+    print(f"first-player win rate: {stats['first_player_win_rate']:.3f}")
+    print(f"average length: {stats['average_length']:.2f} plies")
+    print("openings (X's first cell):")
+    for cell, counts in stats["openings"].items():
+        total = sum(counts.values()) or 1
+        print(f"  {cell}: X {counts['X'] / total:.3f}  O {counts['O'] / total:.3f}  "
+              f"draw {counts['Draw'] / total:.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
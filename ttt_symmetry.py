@@ -0,0 +1,79 @@
+from ttt_bitboard import Bitboard
+
+# ---------------------
+# Symmetry Tables
+# ---------------------
+# The 8 symmetries of the square as cell permutations: PERMS[s][i] is where
+# cell i ends up under symmetry s. PERMS[0] is the identity.
+_ROTATE = (6, 3, 0, 7, 4, 1, 8, 5, 2)   # new cell i takes old cell _ROTATE[i]
+_MIRROR = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+
+
+def _compose(p, q):
+    return tuple(p[q[i]] for i in range(9))
+
+
+def _build_perms():
+    identity = tuple(range(9))
+    sources = []
+    rot = identity
+    for _ in range(4):
+        sources.append(rot)
+        sources.append(_compose(rot, _MIRROR))
+        rot = _compose(rot, _ROTATE)
+    # Turn "new cell takes old cell" into "old cell goes to new cell".
+    perms = []
+    for src in sources:
+        dest = [0] * 9
+        for new, old in enumerate(src):
+            dest[old] = new
+        perms.append(tuple(dest))
+    return tuple(perms)
+
+
+PERMS = _build_perms()
+INVERSE = tuple(PERMS.index(tuple(sorted(range(9), key=p.__getitem__))) for p in PERMS)
+
+# MAPPED[s][bits] is the 9-bit mask ``bits`` under symmetry s.
+MAPPED = tuple(
+    tuple(sum(1 << p[i] for i in range(9) if bits >> i & 1) for bits in range(1 << 9))
+    for p in PERMS
+)
+
+
+# ---------------------
+# Canonical Keys
+# ---------------------
+def canonical(x, o):
+    """Return ``(key, sym)`` for the position's canonical form.
+
+    ``key`` packs the smallest of the 8 symmetric ``(x, o)`` pairs into one
+    int (``x | o << 9``); ``sym`` is the symmetry that maps the given
+    position onto it.
+    """
+    best, best_sym = None, 0
+    for s in range(8):
+        table = MAPPED[s]
+        key = table[x] | table[o] << 9
+        if best is None or key < best:
+            best, best_sym = key, s
+    return best, best_sym
+
+
+def canonical_key(board):
+    bb = board if isinstance(board, Bitboard) else Bitboard.from_cells(board)
+    return canonical(bb.x, bb.o)[0]
+
+
+def from_key(key):
+    return Bitboard(key & 0x1FF, key >> 9)
+
+
+def map_move(move, sym):
+    """Cell ``move`` of the original position in canonical coordinates."""
+    return PERMS[sym][move]
+
+
+def unmap_move(move, sym):
+    """Cell ``move`` in canonical coordinates back in the original position."""
+    return PERMS[INVERSE[sym]][move]
@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+from array import array
+from typing import NamedTuple
+
+from ttt_bitboard import FULL, Bitboard, has_line
+from ttt_engine import MOVE_ORDER
+
+# ---------------------
+# Position Indexing
+# ---------------------
+# Every 3x3 board maps to a base-3 number (empty=0, X=1, O=2), so the whole
+# game fits in dense arrays of 3**9 entries indexed directly by position.
+SIZE = 3 ** 9
+TERNARY = tuple(sum(3 ** i for i in range(9) if bits >> i & 1) for bits in range(1 << 9))
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ttt_table.bin")
+
+UNREACHABLE = -128
+WIN, DRAW, LOSS = 1, 0, -1
+
+
+def index_of(bb):
+    return TERNARY[bb.x] + 2 * TERNARY[bb.o]
+
+
+class Entry(NamedTuple):
+    value: int        # WIN / DRAW / LOSS for the player to move
+    depth: int        # plies until the game ends with perfect play
+    moves: tuple      # every move that keeps the value and depth
+
+
+# ---------------------
+# Solver
+# ---------------------
+def solve():
+    """Solve every reachable position; returns (value, depth, moves) arrays."""
+    value = array("b", [UNREACHABLE]) * SIZE
+    depth = array("B", [0]) * SIZE
+    moves = array("H", [0]) * SIZE
+
+    def visit(mine, theirs, x_to_move):
+        bb = Bitboard(mine, theirs) if x_to_move else Bitboard(theirs, mine)
+        idx = index_of(bb)
+        if value[idx] != UNREACHABLE:
+            return value[idx], depth[idx]
+        occupied = mine | theirs
+        if has_line(theirs):
+            value[idx], depth[idx] = LOSS, 0
+            return LOSS, 0
+        if occupied == FULL:
+            value[idx], depth[idx] = DRAW, 0
+            return DRAW, 0
+
+        best_key, best_mask = None, 0
+        for i in range(9):
+            bit = 1 << i
+            if occupied & bit:
+                continue
+            v, d = visit(theirs, mine | bit, not x_to_move)
+            v, d = -v, d + 1
+            # Prefer higher value; win fast, lose slow, draw at any length.
+            key = (v, -d if v == WIN else d if v == LOSS else 0)
+            if best_key is None or key > best_key:
+                best_key, best_mask, best_depth = key, bit, d
+            elif key == best_key:
+                best_mask |= bit
+        value[idx], depth[idx], moves[idx] = best_key[0], best_depth, best_mask
+        return best_key[0], best_depth
+
+    visit(0, 0, True)
+    return value, depth, moves
+
+
+# ---------------------
+# Lookup Table
+# ---------------------
+class PerfectPlayTable:
+    """Solved values, depths and best moves for every reachable position."""
+
+    def __init__(self, value, depth, moves):
+        self.value = value
+        self.depth = depth
+        self.moves = moves
+
+    @classmethod
+    def build(cls):
+        return cls(*solve())
+
+    def save(self, path=TABLE_PATH):
+        arrays = [self.value, self.depth, self.moves]
+        if sys.byteorder == "big":
+            arrays = [array(a.typecode, a) for a in arrays]
+            arrays[2].byteswap()
+        with open(path, "wb") as f:
+            for a in arrays:
+                a.tofile(f)
+
+    @classmethod
+    def load(cls, path=TABLE_PATH):
+        """Load the table from disk, solving and saving it first if missing."""
+        if not os.path.exists(path):
+            table = cls.build()
+            table.save(path)
+            return table
+        with open(path, "rb") as f:
+            data = f.read()
+        value = array("b", data[:SIZE])
+        depth = array("B", data[SIZE:2 * SIZE])
+        moves = array("H", data[2 * SIZE:])
+        if sys.byteorder == "big":
+            moves.byteswap()
+        return cls(value, depth, moves)
+
+    def lookup(self, board):
+        bb = board if isinstance(board, Bitboard) else Bitboard.from_cells(board)
+        idx = index_of(bb)
+        v = self.value[idx]
+        if v == UNREACHABLE:
+            raise ValueError("position is not reachable from the empty board")
+        mask = self.moves[idx]
+        return Entry(v, self.depth[idx], tuple(i for i in range(9) if mask >> i & 1))
+
+    def best_move(self, board):
+        """Return a perfect-play move for the side to move, or None if the game is over."""
+        moves = self.lookup(board).moves
+        for i in MOVE_ORDER:
+            if i in moves:
+                return i
+        return None
+
+
+def benchmark():
+    start = time.perf_counter()
+    table = PerfectPlayTable.build()
+    print(f"solve: {(time.perf_counter() - start) * 1000:.1f} ms, "
+          f"{sum(v != UNREACHABLE for v in table.value)} reachable positions")
+    start = time.perf_counter()
+    table = PerfectPlayTable.load()
+    print(f"load:  {(time.perf_counter() - start) * 1000:.2f} ms ({os.path.getsize(TABLE_PATH)} bytes)")
+    board = Bitboard()
+    start = time.perf_counter()
+    n = 100_000
+    for _ in range(n):
+        table.lookup(board)
+    print(f"lookup: {(time.perf_counter() - start) / n * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    if "--build" in sys.argv:
+        PerfectPlayTable.build().save()
+    benchmark()
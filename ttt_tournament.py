@@ -0,0 +1,161 @@
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ttt_board import line_through
+from ttt_engine import Engine
+from ttt_game import Game
+from ttt_mcts import search
+
+MCTS_BUDGET = 0.02          # seconds per move for the MCTS agent
+CHUNK = 50                  # games per worker task
+ELO_K = 16
+ELO_START = 1500.0
+
+
+# ---------------------
+# Agents
+# ---------------------
+# An agent is a plain function (game, rng) -> move, registered by name so
+# worker processes can look it up instead of pickling it.
+def random_agent(game, rng):
+    return rng.choice(game.legal_moves())
+
+
+def _completes_line(game, move, player):
+    game.board[move] = player
+    done = bool(line_through(game.board, game.n, game.k, move))
+    game.board[move] = ""
+    return done
+
+
+def heuristic_agent(game, rng):
+    """Win if possible, else block, else take the cell nearest the centre."""
+    moves = game.legal_moves()
+    opponent = "O" if game.player == "X" else "X"
+    for player in (game.player, opponent):
+        for move in moves:
+            if _completes_line(game, move, player):
+                return move
+    mid = (game.n - 1) / 2
+    best = min(abs(m // game.n - mid) + abs(m % game.n - mid) for m in moves)
+    return rng.choice([m for m in moves if abs(m // game.n - mid) + abs(m % game.n - mid) == best])
+
+
+_engine = None
+
+
+def minimax_agent(game, rng):
+    global _engine
+    if game.n != 3 or game.k != 3:
+        raise ValueError("the minimax agent only plays 3×3")
+    if _engine is None:
+        _engine = Engine()
+        _engine.warm()
+    return _engine.best_move(game.board, game.player)
+
+
+def mcts_agent(game, rng):
+    visits, _ = search(game.board, game.n, game.k, game.player, game.turns,
+                       MCTS_BUDGET, rng.getrandbits(32))
+    return max(visits, key=visits.get)
+
+
+AGENTS = {
+    "random": random_agent,
+    "heuristic": heuristic_agent,
+    "minimax": minimax_agent,
+    "mcts": mcts_agent,
+}
+
+
+# ---------------------
+# Matches
+# ---------------------
+def play_games(a, b, games, n, k, seed):
+    """Play ``games`` games of agent ``a`` against ``b``, alternating who
+    starts. Returns ``a``'s score per game: 1 win, 0.5 draw, 0 loss."""
+    rng = random.Random(seed)
+    agents = (AGENTS[a], AGENTS[b])
+    scores = []
+    for g in range(games):
+        first = g % 2                      # 0: a plays X, 1: b plays X
+        game = Game(n, k)
+        turn = first
+        while not game.is_over():
+            game.play(agents[turn](game, rng))
+            turn ^= 1
+        winner = game.winner()
+        if winner == "Draw":
+            scores.append(0.5)
+        else:
+            a_mark = "X" if first == 0 else "O"
+            scores.append(1.0 if winner == a_mark else 0.0)
+    return scores
+
+
+def elo(names, results):
+    """Sequential Elo over ``(a, b, score_for_a)`` results."""
+    ratings = dict.fromkeys(names, ELO_START)
+    for a, b, score in results:
+        expected = 1 / (1 + 10 ** ((ratings[b] - ratings[a]) / 400))
+        delta = ELO_K * (score - expected)
+        ratings[a] += delta
+        ratings[b] -= delta
+    return ratings
+
+
+def round_robin(names, games_per_pair=100, n=3, k=3, workers=None, seed=None):
+    """Every pair plays ``games_per_pair`` games, split into chunks across a
+    process pool. Returns ratings, per-pair results and throughput."""
+    rng = random.Random(seed)
+    tasks = []
+    for a, b in itertools.combinations(names, 2):
+        for start in range(0, games_per_pair, CHUNK):
+            tasks.append((a, b, min(CHUNK, games_per_pair - start), n, k, rng.getrandbits(32)))
+
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        outcomes = [play_games(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(play_games, *zip(*tasks)))
+    elapsed = time.perf_counter() - start
+
+    # Interleave pairs game by game so no pairing dominates the Elo order.
+    streams = [[(task[0], task[1], s) for s in scores] for task, scores in zip(tasks, outcomes)]
+    results = [r for group in itertools.zip_longest(*streams) for r in group if r is not None]
+
+    pairs = {}
+    for a, b, score in results:
+        record = pairs.setdefault((a, b), [0, 0, 0])     # a wins, draws, b wins
+        record[0 if score == 1 else 1 if score == 0.5 else 2] += 1
+    return {
+        "ratings": elo(names, results),
+        "pairs": pairs,
+        "games": len(results),
+        "elapsed": elapsed,
+        "games_per_second": len(results) / elapsed,
+    }
+
+
+def main(argv):
+    games = int(argv[0]) if argv else 200
+    n = int(argv[1]) if len(argv) > 1 else 3
+    k = int(argv[2]) if len(argv) > 2 else n if n <= 4 else 5
+    names = [name for name in AGENTS if n == 3 and k == 3 or name != "minimax"]
+    report = round_robin(names, games, n, k)
+    print(f"{report['games']:,} games on {n}x{n} (k={k}) in {report['elapsed']:.2f} s "
+          f"= {report['games_per_second']:,.0f} games/s")
+    for name, rating in sorted(report["ratings"].items(), key=lambda kv: -kv[1]):
+        print(f"  {name:10s} {rating:7.1f}")
+    for (a, b), (wins, draws, losses) in report["pairs"].items():
+        print(f"  {a} vs {b}: {wins}-{draws}-{losses}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])